@@ -104,9 +104,18 @@ class ChallengeController:
 
         self.view.open_challenge_in_editor(folder_path, challenge_file_path)
 
+        try:
+            with open(challenge_file_path, "r", encoding="utf-8") as f:
+                solution_content = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            # Nothing can be evaluated or graded without the solution.
+            self.view.show_error(f"Could not read solution file: {e}")
+            self.view.cleanup_workspace(folder_path)
+            return
+
         if not config.api.is_configured:
             self._fallback_clipboard_evaluation(
-                challenge, folder_path, challenge_file_path
+                challenge, folder_path, challenge_file_path, solution_content
             )
             return
 
@@ -120,7 +129,12 @@ class ChallengeController:
             )
 
             self._api_evaluation_loop(
-                challenge, session, evaluator, folder_path, challenge_file_path
+                challenge,
+                session,
+                evaluator,
+                folder_path,
+                challenge_file_path,
+                solution_content,
             )
 
         except APIError as e:
@@ -130,7 +144,10 @@ class ChallengeController:
                 and self.view.prompt_fallback_to_clipboard()
             ):
                 self._fallback_clipboard_evaluation(
-                    challenge, folder_path, challenge_file_path
+                    challenge,
+                    folder_path,
+                    challenge_file_path,
+                    solution_content,
                 )
             else:
                 self.view.cleanup_workspace(folder_path)
@@ -145,13 +162,11 @@ class ChallengeController:
         evaluator,
         folder_path: str,
         challenge_file_path: str,
+        solution_content: str,
     ) -> None:
         """
         Main API evaluation loop with dispute/refactor support.
         """
-        with open(challenge_file_path, "r", encoding="utf-8") as f:
-            solution_content = f.read()
-
         self.view.clear_screen()
         with self.view.show_evaluating_spinner():
             evaluation = evaluator.evaluate(session, solution_content)
@@ -213,11 +228,14 @@ class ChallengeController:
         challenge,
         folder_path: str,
         challenge_file_path: str,
+        solution_content: Optional[str] = None,
     ) -> None:
         """
         Original clipboard-based evaluation flow (fallback).
         """
-        self.view.show_evaluation_prompt(challenge_file_path)
+        self.view.show_evaluation_prompt(
+            challenge_file_path, content=solution_content
+        )
         grade = self.view.prompt_grade_input()
 
         if grade is not None:
@@ -81,8 +81,9 @@ class ExportController:
 
             # Write to file
             output_path = Path(output_file)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(export_data.dict(), f, indent=2, ensure_ascii=False)
+            output_path.write_text(
+                export_data.model_dump_json(indent=2), encoding="utf-8"
+            )
 
             # Show summary
             total = (
@@ -198,14 +199,19 @@ class ImportController:
             existing = self.question_repo.get_all()
             existing_texts = {q.question_text for q in existing}
 
-        for q_data in questions_data:
-            if skip_duplicates and q_data.get("question_text") in existing_texts:
-                continue
-
-            question = Question(
-                question_text=q_data["question_text"],
-                tags=q_data.get("tags"),
+        rows = [
+            {
+                "question_text": q_data["question_text"],
+                "tags": q_data.get("tags"),
+            }
+            for q_data in questions_data
+            if not (
+                skip_duplicates
+                and q_data.get("question_text") in existing_texts
             )
+        ]
+
+        for question in Question.validate_many(rows):
             self.question_repo.add(question)
             count += 1
 
@@ -222,17 +228,19 @@ class ImportController:
             existing = self.challenge_repo.get_all()
             existing_titles = {c.title for c in existing}
 
-        for c_data in challenges_data:
-            if skip_duplicates and c_data.get("title") in existing_titles:
-                continue
-
-            challenge = Challenge(
-                title=c_data["title"],
-                description=c_data["description"],
-                language=c_data["language"],
-                testcases=c_data.get("testcases"),
-                tags=c_data.get("tags"),
-            )
+        rows = [
+            {
+                "title": c_data["title"],
+                "description": c_data["description"],
+                "language": c_data["language"],
+                "testcases": c_data.get("testcases"),
+                "tags": c_data.get("tags"),
+            }
+            for c_data in challenges_data
+            if not (skip_duplicates and c_data.get("title") in existing_titles)
+        ]
+
+        for challenge in Challenge.validate_many(rows):
             self.challenge_repo.add(challenge)
             count += 1
 
@@ -249,24 +257,29 @@ class ImportController:
             existing = self.mcq_repo.get_all()
             existing_questions = {m.question for m in existing}
 
-        for m_data in mcq_data:
-            if skip_duplicates and m_data.get("question") in existing_questions:
-                continue
-
-            mcq = MCQQuestion(
-                question=m_data["question"],
-                question_type=m_data["question_type"],
-                option_a=m_data["option_a"],
-                option_b=m_data["option_b"],
-                option_c=m_data.get("option_c"),
-                option_d=m_data.get("option_d"),
-                correct_option=m_data["correct_option"],
-                explanation_a=m_data.get("explanation_a"),
-                explanation_b=m_data.get("explanation_b"),
-                explanation_c=m_data.get("explanation_c"),
-                explanation_d=m_data.get("explanation_d"),
-                tags=m_data.get("tags"),
+        rows = [
+            {
+                "question": m_data["question"],
+                "question_type": m_data["question_type"],
+                "option_a": m_data["option_a"],
+                "option_b": m_data["option_b"],
+                "option_c": m_data.get("option_c"),
+                "option_d": m_data.get("option_d"),
+                "correct_option": m_data["correct_option"],
+                "explanation_a": m_data.get("explanation_a"),
+                "explanation_b": m_data.get("explanation_b"),
+                "explanation_c": m_data.get("explanation_c"),
+                "explanation_d": m_data.get("explanation_d"),
+                "tags": m_data.get("tags"),
+            }
+            for m_data in mcq_data
+            if not (
+                skip_duplicates
+                and m_data.get("question") in existing_questions
             )
+        ]
+
+        for mcq in MCQQuestion.validate_many(rows):
             self.mcq_repo.add(mcq)
             count += 1
 
@@ -1,7 +1,15 @@
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_validator,
+)
+
+from src.models.fields import OptionalText, RequiredText
 
 
 class Challenge(BaseModel):
@@ -11,17 +19,17 @@ class Challenge(BaseModel):
     """
 
     id: Optional[int] = None
-    title: str = Field(..., min_length=1, description="The challenge title")
-    description: str = Field(
-        ..., min_length=1, description="The challenge description"
+    title: RequiredText = Field(..., description="The challenge title")
+    description: RequiredText = Field(
+        ..., description="The challenge description"
     )
-    testcases: Optional[str] = Field(
+    testcases: OptionalText = Field(
         None, description="Test cases for the challenge"
     )
     language: str = Field(
         ..., pattern="^(python|javascript|go)$", description="Programming language"
     )
-    tags: Optional[str] = None
+    tags: OptionalText = None
     last_reviewed: Optional[date] = Field(
         default_factory=lambda: date.today(), description="Last review date"
     )
@@ -32,48 +40,32 @@ class Challenge(BaseModel):
         default=2.5, ge=1.3, le=3.0, description="SM-2 ease factor"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
-        use_enum_values = True
-
-    @validator("title")
-    def title_not_empty(cls, v):
-        """Ensure title is not just whitespace."""
-        if not v or not v.strip():
-            raise ValueError("Title cannot be empty")
-        return v.strip()
-
-    @validator("description")
-    def description_not_empty(cls, v):
-        """Ensure description is not just whitespace."""
-        if not v or not v.strip():
-            raise ValueError("Description cannot be empty")
-        return v.strip()
-
-    @validator("testcases")
-    def clean_testcases(cls, v):
-        """Clean and normalize testcases."""
-        if v:
-            cleaned = v.strip()
-            return cleaned if cleaned else None
-        return v
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
-    @validator("language")
+    @field_validator("language")
+    @classmethod
     def validate_language(cls, v):
         """Ensure language is supported."""
         if v not in ["python", "javascript", "go"]:
             raise ValueError("Language must be python, javascript, or go")
         return v.lower()
 
-    @validator("tags")
-    def clean_tags(cls, v):
-        """Clean and normalize tags."""
-        if v:
-            return v.strip() if v.strip() else None
-        return v
+    @classmethod
+    def validate_many(cls, rows: List[dict]) -> List["Challenge"]:
+        """
+        Validate a batch of raw rows in a single pydantic-core call.
+
+        Args:
+            rows: Field dictionaries, one per Challenge
+
+        Returns:
+            Validated Challenge instances, in input order
+        """
+        return _CHALLENGES_ADAPTER.validate_python(rows)
 
     def __str__(self) -> str:
         """String representation for display purposes."""
         return f"Challenge(id={self.id}, title='{self.title}', language={self.language})"
+
+
+_CHALLENGES_ADAPTER = TypeAdapter(List[Challenge])
@@ -8,6 +8,24 @@ from typing import List, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+# Grade patterns, tried in order against the lowercased response. A bare
+# number may only match from the start of a digit run; otherwise findall()
+# retries from every digit and long digit runs take quadratic time.
+_GRADE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r"\*\*\s*(?:score|grade|average)[:\s]*(\d+(?:\.\d+)?)\s*(?:/\s*3)?\s*\*\*",
+        r"(?:score|grade|average)[:\s]*(\d+(?:\.\d+)?)\s*(?:/\s*3)?",
+        r"(?<!\d)(\d+(?:\.\d+)?)\s*/\s*3",
+        r":\s*(\d+(?:\.\d+)?)\s*$",
+    )
+)
+_NUMBER_RE = re.compile(r"(\d+(?:\.\d+)?)")
+_SCORE_PATTERNS = {
+    category: re.compile(rf"{category}[:\s]*(\d+(?:\.\d+)?)")
+    for category in ("correctness", "clarity", "efficiency")
+}
+
 
 class Message(BaseModel):
     """Single message in conversation history."""
@@ -65,20 +83,14 @@ class EvaluationResponse(BaseModel):
     @staticmethod
     def _extract_grade(text: str) -> float:
         """Extract the final grade from response text."""
-        patterns = [
-            r"\*\*\s*(?:score|grade|average)[:\s]*(\d+(?:\.\d+)?)\s*(?:/\s*3)?\s*\*\*",
-            r"(?:score|grade|average)[:\s]*(\d+(?:\.\d+)?)\s*(?:/\s*3)?",
-            r"(\d+(?:\.\d+)?)\s*/\s*3",
-            r":\s*(\d+(?:\.\d+)?)\s*$",
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text.lower())
+        lowered = text.lower()
+        for pattern in _GRADE_PATTERNS:
+            matches = pattern.findall(lowered)
             if matches:
                 grade = float(matches[-1])
                 return min(3.0, max(0.0, grade))
 
-        numbers = re.findall(r"(\d+(?:\.\d+)?)", text)
+        numbers = _NUMBER_RE.findall(text)
         for num in reversed(numbers):
             val = float(num)
             if 0 <= val <= 3:
@@ -89,8 +101,10 @@ class EvaluationResponse(BaseModel):
     @staticmethod
     def _extract_score(text: str, category: str) -> Optional[float]:
         """Extract individual category score."""
-        pattern = rf"{category}[:\s]*(\d+(?:\.\d+)?)"
-        match = re.search(pattern, text.lower())
+        pattern = _SCORE_PATTERNS.get(category)
+        if pattern is None:
+            pattern = re.compile(rf"{category}[:\s]*(\d+(?:\.\d+)?)")
+        match = pattern.search(text.lower())
         if match:
             return float(match.group(1))
         return None
@@ -0,0 +1,24 @@
+"""
+Reusable annotated field types shared by the entity models.
+"""
+from typing import Annotated, Any, Optional
+
+from pydantic import BeforeValidator, StringConstraints
+
+
+def _strip_or_none(value: Any) -> Any:
+    """Strip surrounding whitespace; whitespace-only text becomes None."""
+    if isinstance(value, str) and value:
+        return value.strip() or None
+    return value
+
+
+# Required text: surrounding whitespace is stripped and the result must
+# not be empty. Both checks run inside pydantic-core.
+RequiredText = Annotated[
+    str, StringConstraints(strip_whitespace=True, min_length=1)
+]
+
+# Optional text: stripped, with whitespace-only values stored as None.
+# An empty string is kept as-is.
+OptionalText = Annotated[Optional[str], BeforeValidator(_strip_or_none)]
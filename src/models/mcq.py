@@ -1,7 +1,15 @@
 from datetime import date
-from typing import Optional
+from typing import List, Literal, Optional
 
-from pydantic import BaseModel, Field, model_validator, validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    model_validator,
+)
+
+from src.models.fields import OptionalText, RequiredText
 
 
 class MCQQuestion(BaseModel):
@@ -11,34 +19,34 @@ class MCQQuestion(BaseModel):
     """
 
     id: Optional[int] = None
-    question: str = Field(..., min_length=1, description="The question text")
-    question_type: str = Field(
-        ..., pattern="^(mcq|true_false)$", description="Type of question"
+    question: RequiredText = Field(..., description="The question text")
+    question_type: Literal["mcq", "true_false"] = Field(
+        ..., description="Type of question"
     )
-    option_a: str = Field(..., min_length=1, description="Option A text")
-    option_b: str = Field(..., min_length=1, description="Option B text")
-    option_c: Optional[str] = Field(
+    option_a: RequiredText = Field(..., description="Option A text")
+    option_b: RequiredText = Field(..., description="Option B text")
+    option_c: OptionalText = Field(
         None, description="Option C text (MCQ only)"
     )
-    option_d: Optional[str] = Field(
+    option_d: OptionalText = Field(
         None, description="Option D text (MCQ only)"
     )
-    correct_option: str = Field(
-        ..., pattern="^[a-d]$", description="Correct option letter"
+    correct_option: Literal["a", "b", "c", "d"] = Field(
+        ..., description="Correct option letter"
     )
-    explanation_a: Optional[str] = Field(
+    explanation_a: OptionalText = Field(
         None, description="Explanation for option A"
     )
-    explanation_b: Optional[str] = Field(
+    explanation_b: OptionalText = Field(
         None, description="Explanation for option B"
     )
-    explanation_c: Optional[str] = Field(
+    explanation_c: OptionalText = Field(
         None, description="Explanation for option C"
     )
-    explanation_d: Optional[str] = Field(
+    explanation_d: OptionalText = Field(
         None, description="Explanation for option D"
     )
-    tags: Optional[str] = Field(None, description="Comma-separated tags")
+    tags: OptionalText = Field(None, description="Comma-separated tags")
     last_reviewed: Optional[date] = Field(
         default_factory=lambda: date.today(), description="Last review date"
     )
@@ -49,83 +57,41 @@ class MCQQuestion(BaseModel):
         default=2.5, ge=1.3, le=3.0, description="SM-2 ease factor"
     )
 
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
-        use_enum_values = True
-
-    @validator("question")
-    def question_not_empty(cls, v):
-        """Ensure question is not just whitespace."""
-        if not v or not v.strip():
-            raise ValueError("Question cannot be empty")
-        return v.strip()
-
-    @validator("option_a", "option_b")
-    def required_options_not_empty(cls, v):
-        """Ensure required options are not empty."""
-        if not v or not v.strip():
-            raise ValueError("Options A and B are required")
-        return v.strip()
-
-    @validator("option_c", "option_d")
-    def optional_options_clean(cls, v):
-        """Clean optional options."""
-        if v:
-            cleaned = v.strip()
-            return cleaned if cleaned else None
-        return v
-
-    @validator("tags")
-    def clean_tags(cls, v):
-        """Clean and normalize tags."""
-        if v:
-            cleaned = v.strip()
-            return cleaned if cleaned else None
-        return v
-
-    @validator(
-        "explanation_a", "explanation_b", "explanation_c", "explanation_d"
-    )
-    def clean_explanations(cls, v):
-        """Clean explanation fields."""
-        if v:
-            cleaned = v.strip()
-            return cleaned if cleaned else None
-        return v
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
     @model_validator(mode="after")
-    def validate_question_consistency(cls, model):
+    def validate_question_consistency(self) -> "MCQQuestion":
         """Validate that question type matches available options and correct answer."""
-        question_type = model.question_type
-        option_c = model.option_c
-        option_d = model.option_d
-        correct_option = model.correct_option
-
-        if question_type == "true_false":
-            if option_c is not None or option_d is not None:
+        if self.question_type == "true_false":
+            if self.option_c is not None or self.option_d is not None:
                 raise ValueError(
                     "True/False questions should only have option_a and option_b"
                 )
 
-            if correct_option not in ["a", "b"]:
+            if self.correct_option not in ("a", "b"):
                 raise ValueError(
                     "For True/False questions, correct_option must be 'a' or 'b'"
                 )
 
-        elif question_type == "mcq":
-            if not option_c or not option_d:
-                raise ValueError(
-                    "MCQ questions require all four options (a, b, c, d)"
-                )
+        elif not self.option_c or not self.option_d:
+            raise ValueError(
+                "MCQ questions require all four options (a, b, c, d)"
+            )
 
-            if correct_option not in ["a", "b", "c", "d"]:
-                raise ValueError(
-                    "For MCQ questions, correct_option must be 'a', 'b', 'c', or 'd'"
-                )
+        return self
+
+    @classmethod
+    def validate_many(cls, rows: List[dict]) -> List["MCQQuestion"]:
+        """
+        Validate a batch of raw rows in a single pydantic-core call.
+
+        Args:
+            rows: Field dictionaries, one per MCQQuestion
 
-        return model
+        Returns:
+            Validated MCQQuestion instances, in input order
+        """
+        return _MCQ_QUESTIONS_ADAPTER.validate_python(rows)
 
     def __str__(self) -> str:
         """String representation for display purposes."""
@@ -133,3 +99,6 @@ class MCQQuestion(BaseModel):
             "..." if len(self.question) > 50 else ""
         )
         return f"MCQQuestion(id={self.id}, type={self.question_type}, question='{question_preview}')"
+
+
+_MCQ_QUESTIONS_ADAPTER = TypeAdapter(List[MCQQuestion])
@@ -1,7 +1,9 @@
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+from src.models.fields import OptionalText, RequiredText
 
 
 class Question(BaseModel):
@@ -11,10 +13,10 @@ class Question(BaseModel):
     """
 
     id: Optional[int] = None
-    question_text: str = Field(
-        ..., min_length=1, description="The question text"
+    question_text: RequiredText = Field(
+        ..., description="The question text"
     )
-    tags: Optional[str] = None
+    tags: OptionalText = None
     last_reviewed: Optional[date] = None
     interval: int = Field(
         default=1, ge=1, description="Days until next review"
@@ -23,25 +25,20 @@ class Question(BaseModel):
         default=2.5, ge=1.3, le=3.0, description="SM-2 ease factor"
     )
 
-    class Config:
-        """Pydantic configuration."""
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
-        from_attributes = True
-        use_enum_values = True
+    @classmethod
+    def validate_many(cls, rows: List[dict]) -> List["Question"]:
+        """
+        Validate a batch of raw rows in a single pydantic-core call.
 
-    @validator("question_text")
-    def question_text_not_empty(cls, v):
-        """Ensure question text is not just whitespace."""
-        if not v or not v.strip():
-            raise ValueError("Question text cannot be empty")
-        return v.strip()
+        Args:
+            rows: Field dictionaries, one per Question
 
-    @validator("tags")
-    def clean_tags(cls, v):
-        """Clean and normalize tags."""
-        if v:
-            return v.strip() if v.strip() else None
-        return v
+        Returns:
+            Validated Question instances, in input order
+        """
+        return _QUESTIONS_ADAPTER.validate_python(rows)
 
     def __str__(self) -> str:
         """String representation for display purposes."""
@@ -49,3 +46,6 @@ class Question(BaseModel):
             "..." if len(self.question_text) > 50 else ""
         )
         return f"Question(id={self.id}, text='{text_preview}')"
+
+
+_QUESTIONS_ADAPTER = TypeAdapter(List[Question])
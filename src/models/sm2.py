@@ -1,7 +1,18 @@
-from datetime import timedelta
 from typing import Tuple
 
 
+def _ease_adjustment(rating: float) -> float:
+    """Ease factor change for a successful recall with the given rating."""
+    return 0.1 - (3 - rating) * (0.08 + (3 - rating) * 0.02)
+
+
+# Ratings are almost always whole numbers, so their adjustments are
+# computed once; fractional ratings fall back to _ease_adjustment().
+_EASE_ADJUSTMENTS = {rating: _ease_adjustment(rating) for rating in (1, 2, 3)}
+
+_CONFIDENCE_RATINGS = {"low": 1, "medium": 2, "high": 3}
+
+
 class SM2Calculator:
     """
     Pure SM-2 (SuperMemo 2) algorithm implementation.
@@ -40,7 +51,9 @@ class SM2Calculator:
             new_interval = 1
             new_ease_factor = max(1.3, current_ease_factor - 0.2)
         else:
-            ease_adjustment = 0.1 - (3 - rating) * (0.08 + (3 - rating) * 0.02)
+            ease_adjustment = _EASE_ADJUSTMENTS.get(rating)
+            if ease_adjustment is None:
+                ease_adjustment = _ease_adjustment(rating)
             new_ease_factor = current_ease_factor + ease_adjustment
             new_interval = max(1, round(current_interval * new_ease_factor))
 
@@ -69,21 +82,13 @@ class SM2Calculator:
         Raises:
             ValueError: If confidence_level is not valid
         """
-        valid_confidence = ["low", "medium", "high"]
-        if confidence_level not in valid_confidence:
+        if confidence_level not in _CONFIDENCE_RATINGS:
             raise ValueError(
-                f"confidence_level must be one of {valid_confidence}"
+                "confidence_level must be one of "
+                f"{list(_CONFIDENCE_RATINGS)}"
             )
 
-        if is_correct:
-            if confidence_level == "high":
-                sm2_rating = 3
-            elif confidence_level == "medium":
-                sm2_rating = 2
-            else:
-                sm2_rating = 1
-        else:
-            sm2_rating = 0
+        sm2_rating = _CONFIDENCE_RATINGS[confidence_level] if is_correct else 0
 
         new_interval, new_ease_factor = SM2Calculator.calculate_next_review(
             sm2_rating, current_interval, current_ease_factor
@@ -111,8 +116,10 @@ class SM2Calculator:
         if last_reviewed_date is None:
             return True
 
-        next_review_date = last_reviewed_date + timedelta(days=interval_days)
-        return current_date >= next_review_date
+        days_diff = SM2Calculator._days_past_due(
+            last_reviewed_date, interval_days, current_date
+        )
+        return days_diff >= 0
 
     @staticmethod
     def days_overdue(last_reviewed_date, interval_days, current_date) -> float:
@@ -130,6 +137,16 @@ class SM2Calculator:
         if last_reviewed_date is None:
             return float("inf")
 
-        next_review_date = last_reviewed_date + timedelta(days=interval_days)
-        days_diff = (current_date - next_review_date).days
+        days_diff = SM2Calculator._days_past_due(
+            last_reviewed_date, interval_days, current_date
+        )
         return max(0.0, float(days_diff))
+
+    @staticmethod
+    def _days_past_due(last_reviewed_date, interval_days, current_date) -> int:
+        """Days between the next review date and current_date (may be < 0)."""
+        return (
+            current_date.toordinal()
+            - last_reviewed_date.toordinal()
+            - interval_days
+        )
@@ -363,6 +363,9 @@ class ChallengeRepository:
         """
         Convert a database row to a Challenge object.
 
+        The database is the source of truth, so the row is not
+        re-validated; stored SM-2 values come back as written.
+
         Args:
             row: Database row tuple
 
@@ -373,7 +376,7 @@ class ChallengeRepository:
         if row[6]:
             last_reviewed = date.fromisoformat(row[6])
 
-        return Challenge(
+        return Challenge.model_construct(
             id=row[0],
             title=row[1],
             description=row[2],
@@ -387,6 +387,9 @@ class MCQRepository:
         """
         Convert a database row to an MCQQuestion object.
 
+        Stored rows are trusted as-is and built without validation,
+        including ease factors that mark_reviewed() let fall below 1.3.
+
         Args:
             row: Database row tuple
 
@@ -397,7 +400,7 @@ class MCQRepository:
         if row[13]:
             last_reviewed = date.fromisoformat(row[13])
 
-        return MCQQuestion(
+        return MCQQuestion.model_construct(
             id=row[0],
             question=row[1],
             question_type=row[2],
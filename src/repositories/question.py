@@ -280,6 +280,9 @@ class QuestionRepository:
         """
         Convert a database row to a Question object.
 
+        Built with model_construct(): what the database holds is trusted,
+        not re-checked against the model's constraints.
+
         Args:
             row: Database row tuple
 
@@ -290,7 +293,7 @@ class QuestionRepository:
         if row[3]:
             last_reviewed = date.fromisoformat(row[3])
 
-        return Question(
+        return Question.model_construct(
             id=row[0],
             question_text=row[1],
             tags=row[2],
@@ -5,8 +5,6 @@ Uses httpx for HTTP requests with OpenAI-compatible format.
 import os
 from typing import List, Optional
 
-import httpx
-
 from src.models.evaluation import Message
 
 
@@ -27,6 +25,11 @@ class ZAIClient:
         "coding": "https://api.z.ai/api/coding/paas/v4",
     }
 
+    # Requests in an evaluation are separated by the user reading feedback
+    # and typing a dispute, so keep the idle connection around well past
+    # httpx's 5 second default instead of paying a new TLS handshake.
+    KEEPALIVE_EXPIRY = 300.0
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -42,6 +45,8 @@ class ZAIClient:
             base_url: Which base URL to use ("default" or "coding").
             timeout: Request timeout in seconds.
         """
+        import httpx
+
         self.api_key = api_key or os.getenv("ZAI_API_KEY")
         if not self.api_key:
             raise APIError(
@@ -50,7 +55,18 @@ class ZAIClient:
 
         self.base_url = self.BASE_URLS.get(base_url, base_url)
         self.timeout = timeout
-        self._client = httpx.Client(timeout=timeout)
+        self._endpoint = f"{self.base_url}/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+        self._client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_keepalive_connections=1,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY,
+            ),
+        )
 
     def chat_completion(
         self,
@@ -72,10 +88,7 @@ class ZAIClient:
         Raises:
             APIError: On API communication failure
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+        import httpx
 
         payload = {
             "model": model,
@@ -85,8 +98,8 @@ class ZAIClient:
 
         try:
             response = self._client.post(
-                f"{self.base_url}/chat/completions",
-                headers=headers,
+                self._endpoint,
+                headers=self._headers,
                 json=payload,
             )
             response.raise_for_status()
@@ -1,7 +1,7 @@
 """
 Evaluation service that coordinates API calls and session management.
 """
-from typing import Optional
+from typing import List, Optional
 
 from src.models.evaluation import (
     EvaluationResponse,
@@ -24,15 +24,30 @@ class EvaluationService:
     - Maintaining conversation history
     """
 
-    def __init__(self, api_client: Optional[ZAIClient] = None):
+    def __init__(
+        self,
+        api_client: Optional[ZAIClient] = None,
+        max_context_messages: Optional[int] = None,
+    ):
         """
         Initialize the evaluation service.
 
         Args:
             api_client: Optional pre-configured API client.
                         If not provided, creates one lazily.
+            max_context_messages: Optional cap on how many of the most
+                        recent follow-up messages are sent with each
+                        request. The system prompt and the first user
+                        message (the solution) are always sent.
+                        If not provided, the full history is sent.
+
+        Raises:
+            ValueError: If max_context_messages is less than 1
         """
+        if max_context_messages is not None and max_context_messages < 1:
+            raise ValueError("max_context_messages must be at least 1")
         self._client = api_client
+        self.max_context_messages = max_context_messages
 
     @property
     def client(self) -> ZAIClient:
@@ -86,7 +101,9 @@ class EvaluationService:
         )
         session.add_user_message(prompt)
 
-        response_text = self.client.chat_completion(session.messages)
+        response_text = self.client.chat_completion(
+            self._context_messages(session)
+        )
         session.add_assistant_response(response_text)
 
         evaluation = EvaluationResponse.parse_from_response(response_text)
@@ -116,7 +133,9 @@ class EvaluationService:
         )
         session.add_user_message(dispute_prompt)
 
-        response_text = self.client.chat_completion(session.messages)
+        response_text = self.client.chat_completion(
+            self._context_messages(session)
+        )
         session.add_assistant_response(response_text)
 
         evaluation = EvaluationResponse.parse_from_response(response_text)
@@ -146,7 +165,9 @@ class EvaluationService:
         )
         session.add_user_message(refactor_prompt)
 
-        response_text = self.client.chat_completion(session.messages)
+        response_text = self.client.chat_completion(
+            self._context_messages(session)
+        )
         session.add_assistant_response(response_text)
 
         evaluation = EvaluationResponse.parse_from_response(response_text)
@@ -154,6 +175,29 @@ class EvaluationService:
 
         return evaluation
 
+    def _context_messages(self, session: EvaluationSession) -> List[Message]:
+        """
+        Select the messages to send for the next request.
+
+        Always keeps the system prompt and the first user message, which
+        holds the solution being graded, followed by the most recent
+        max_context_messages messages. The window starts on an assistant
+        reply so turns stay paired, unless it is just the latest user
+        message. Older turns are discarded from the request, not
+        summarised; the session itself always keeps the full history.
+        """
+        messages = session.messages
+        if (
+            self.max_context_messages is None
+            or len(messages) <= self.max_context_messages + 2
+        ):
+            return messages
+
+        window = messages[-self.max_context_messages :]
+        if len(window) > 1 and window[0].role == "user":
+            window = window[1:]
+        return [*messages[:2], *window]
+
     def close(self) -> None:
         """Clean up resources."""
         if self._client:
@@ -51,3 +51,43 @@ Here is the full content of my solution:\n
 {challenge_content}\n\n
 Please provide your evaluation + Score.
 """
+
+PYTHON_CHALLENGE_FILE_TEMPLATE = '''"""
+Title: {title}
+
+Description:
+{description}
+"""
+
+
+def {function_name}():
+    # Write your solution here...
+    pass
+'''
+
+JAVASCRIPT_CHALLENGE_FILE_TEMPLATE = """/*
+Title: {title}
+
+Description:
+{description}
+*/
+
+function {function_name}() {{
+    // write your solution here...
+}}
+
+module.exports = {function_name};"""
+
+GO_CHALLENGE_FILE_TEMPLATE = """package main
+
+/*
+Title: {title}
+
+Description:
+{description}
+*/
+
+func {function_name}() {{
+\t// Write your solution here...
+}}
+"""
@@ -1,20 +1,56 @@
 import os
 import re
+import shlex
 import shutil
-import subprocess
-import tempfile
-from typing import List, Optional, Tuple
-
-import pyperclip
-import questionary
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
-from rich.rule import Rule
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.models.challenge import Challenge
 from src.models.evaluation import EvaluationResponse, UserAction
-from src.templates import CHALLENGE_PROMPT_TEMPLATE
+from src.templates import (
+    CHALLENGE_PROMPT_TEMPLATE,
+    GO_CHALLENGE_FILE_TEMPLATE,
+    JAVASCRIPT_CHALLENGE_FILE_TEMPLATE,
+    PYTHON_CHALLENGE_FILE_TEMPLATE,
+)
+from src.views.console import copy_in_background, get_console
+from src.views.pagination import select_paginated
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+class _FolderNameTable(dict):
+    """
+    str.translate table for folder names.
+    Keeps ASCII letters/digits (lowercased), turns whitespace into "_"
+    and drops everything else. Non-ASCII code points are resolved on
+    first lookup and cached.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        value = "_" if chr(codepoint).isspace() else None
+        self[codepoint] = value
+        return value
+
+
+_FOLDER_NAME_TABLE = _FolderNameTable(
+    (
+        i,
+        chr(i).lower()
+        if chr(i).isalnum()
+        else "_" if chr(i).isspace() else None,
+    )
+    for i in range(128)
+)
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
+# The challenge template has a single placeholder, so split it once and
+# concatenate instead of re-parsing the format string on every prompt.
+_PROMPT_PREFIX, _PROMPT_SUFFIX = CHALLENGE_PROMPT_TEMPLATE.split(
+    "{challenge_content}"
+)
 
 
 class ChallengeView:
@@ -23,8 +59,8 @@ class ChallengeView:
     Handles all user interface interactions for challenges.
     """
 
-    def __init__(self, console: Console = None):
-        self.console = console or Console()
+    def __init__(self, console: "Console" = None):
+        self.console = console or get_console()
 
     def prompt_new_challenge(self) -> Optional[Challenge]:
         """
@@ -33,6 +69,8 @@ class ChallengeView:
         Returns:
             Challenge object with user input, or None if cancelled
         """
+        import questionary
+
         title = questionary.text("Enter the title of the challenge:").ask()
         if not title:
             self.show_error("Title cannot be empty.")
@@ -72,7 +110,10 @@ class ChallengeView:
         )
 
     def prompt_challenge_selection(
-        self, challenges: List[Challenge], title: str = "Select a challenge:"
+        self,
+        challenges: List[Challenge],
+        title: str = "Select a challenge:",
+        page_size: int = 50,
     ) -> Optional[Challenge]:
         """
         Display list of challenges for user selection.
@@ -80,6 +121,7 @@ class ChallengeView:
         Args:
             challenges: List of challenges to choose from
             title: Selection prompt title
+            page_size: Lists longer than this are shown one page at a time
 
         Returns:
             Selected challenge or None if cancelled
@@ -88,15 +130,14 @@ class ChallengeView:
             self.show_info("No challenges available.")
             return None
 
-        challenge_choices = [f"ID: {c.id} - {c.title}" for c in challenges]
-
-        selected = questionary.select(title, choices=challenge_choices).ask()
-        if not selected:
+        selected = select_paginated(
+            title, challenges, lambda c: f"ID: {c.id} - {c.title}", page_size
+        )
+        if selected is None:
             self.show_warning("No challenge selected.")
             return None
 
-        selected_id = int(selected.split(":")[1].strip().split(" ")[0])
-        return next(c for c in challenges if c.id == selected_id)
+        return selected
 
     def show_due_challenges(self, challenges: List[Challenge]) -> None:
         """
@@ -109,13 +150,14 @@ class ChallengeView:
             self.show_success("No challenges are due for review today!")
             return
 
-        self.console.print("[bold cyan]Challenges due for review:[/bold cyan]")
+        lines = ["[bold cyan]Challenges due for review:[/bold cyan]"]
         for challenge in challenges:
             tags_str = f" [Tags: {challenge.tags}]" if challenge.tags else ""
-            self.console.print(
+            lines.append(
                 f"[bold yellow]ID {challenge.id}[/bold yellow]: "
                 f"{challenge.title} (Language: {challenge.language}){tags_str}"
             )
+        self.console.print("\n".join(lines))
 
     def show_all_challenges(self, challenges: List[Challenge]) -> None:
         """
@@ -128,16 +170,17 @@ class ChallengeView:
             self.show_success("No challenges in the database yet!")
             return
 
-        self.console.print("[bold cyan]All Challenges:[/bold cyan]")
+        lines = ["[bold cyan]All Challenges:[/bold cyan]"]
         for challenge in challenges:
             tags_str = f", Tags: {challenge.tags}" if challenge.tags else ""
-            self.console.print(
+            lines.append(
                 f"[bold yellow]ID {challenge.id}[/bold yellow]: "
                 f"{challenge.title} "
                 f"(Language: {challenge.language}, "
                 f"Interval: {challenge.interval}, "
                 f"Last Reviewed: {challenge.last_reviewed}{tags_str})"
             )
+        self.console.print("\n".join(lines))
 
     def setup_challenge_workspace(
         self, challenge: Challenge
@@ -152,24 +195,23 @@ class ChallengeView:
             Tuple of (folder_path, challenge_file_path)
         """
         folder_name = self._sanitize_folder_name(challenge.title)
-        os.makedirs(folder_name, exist_ok=True)
+        if not folder_name:
+            raise ValueError(
+                f"Cannot derive a folder name from title: {challenge.title!r}"
+            )
+        folder = Path(folder_name)
+        folder.mkdir(exist_ok=True)
 
         if challenge.language == "python":
-            challenge_file_path = self._setup_python_files(
-                challenge, folder_name
-            )
+            challenge_path = self._setup_python_files(challenge, folder)
         elif challenge.language == "javascript":
-            challenge_file_path = self._setup_javascript_files(
-                challenge, folder_name
-            )
+            challenge_path = self._setup_javascript_files(challenge, folder)
         elif challenge.language == "go":
-            challenge_file_path = self._setup_golang_files(
-                challenge, folder_name
-            )
+            challenge_path = self._setup_golang_files(challenge, folder)
         else:
             raise ValueError(f"Unsupported language: {challenge.language}")
 
-        return folder_name, challenge_file_path
+        return folder_name, str(challenge_path)
 
     def open_challenge_in_editor(
         self, folder_path: str, challenge_file_path: str
@@ -181,6 +223,8 @@ class ChallengeView:
             folder_path: Path to the challenge folder
             challenge_file_path: Path to the main challenge file
         """
+        import subprocess
+
         editor = os.getenv("EDITOR", "nvim")
 
         if editor == "code":
@@ -192,32 +236,49 @@ class ChallengeView:
 
             input("Press ENTER once the challenge is solved...")
         else:
-            os.system(f"{editor} {challenge_file_path}")
+            subprocess.run(
+                [*shlex.split(editor), challenge_file_path],
+                close_fds=False,
+                check=False,
+            )
 
-    def show_evaluation_prompt(self, challenge_file_path: str) -> str:
+    def show_evaluation_prompt(
+        self, challenge_file_path: str, content: Optional[str] = None
+    ) -> str:
         """
         Generate and display the evaluation prompt for the challenge.
         Copies the prompt to clipboard.
 
         Args:
             challenge_file_path: Path to the challenge solution file
+            content: Solution content already read by the caller; when
+                     given, the file is not read again
 
         Returns:
             The generated prompt
         """
         try:
-            with open(challenge_file_path, "r", encoding="utf-8") as f:
-                challenge_content = f.read()
+            if content is None:
+                challenge_content = Path(challenge_file_path).read_text(
+                    encoding="utf-8"
+                )
+            else:
+                challenge_content = content
 
-            prompt = CHALLENGE_PROMPT_TEMPLATE.format(
-                challenge_content=challenge_content
-            )
+            prompt = _PROMPT_PREFIX + challenge_content + _PROMPT_SUFFIX
 
-            pyperclip.copy(prompt)
+            wait_for_copy = copy_in_background(prompt)
 
             self.console.print("[bold cyan]Evaluation Prompt:[/bold cyan]\n")
             self.console.print(prompt.strip())
-            self.show_success("Prompt copied to clipboard!")
+
+            copy_error = wait_for_copy()
+            if isinstance(copy_error, TimeoutError):
+                self.show_warning(str(copy_error))
+            elif copy_error:
+                self.show_error(f"Error copying prompt: {copy_error}")
+            else:
+                self.show_success("Prompt copied to clipboard!")
 
             return prompt
         except Exception as e:
@@ -232,8 +293,9 @@ class ChallengeView:
             folder_path: Path to the folder to remove
         """
         try:
-            if os.path.exists(folder_path):
-                shutil.rmtree(folder_path)
+            shutil.rmtree(folder_path)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             self.show_warning(f"Could not clean up workspace: {e}")
 
@@ -244,6 +306,8 @@ class ChallengeView:
         Returns:
             Grade as float, or None if invalid/cancelled
         """
+        import questionary
+
         grade_input = questionary.text(
             "Enter your score for this challenge (0-3):"
         ).ask()
@@ -276,16 +340,12 @@ class ChallengeView:
         Returns:
             Tuple of (new_title, new_description, new_language, new_testcases, new_tags) or (None, None, None, None, None) if no updates
         """
+        import questionary
+
         self.console.print(
-            f"[bold cyan]Current title:[/bold cyan] {challenge.title}"
-        )
-        self.console.print(
-            f"[bold cyan]Current description:[/bold cyan] {challenge.description}"
-        )
-        self.console.print(
-            f"[bold cyan]Current language:[/bold cyan] {challenge.language}"
-        )
-        self.console.print(
+            f"[bold cyan]Current title:[/bold cyan] {challenge.title}\n"
+            f"[bold cyan]Current description:[/bold cyan] {challenge.description}\n"
+            f"[bold cyan]Current language:[/bold cyan] {challenge.language}\n"
             f"[bold cyan]Current tags:[/bold cyan] {challenge.tags or 'None'}"
         )
 
@@ -328,14 +388,12 @@ class ChallengeView:
                 "Enter the new tags (comma-separated):", default=challenge.tags or ""
             ).ask()
 
-        if not any(
-            [
-                update_title,
-                update_description,
-                update_language,
-                update_testcases,
-                update_tags,
-            ]
+        if not (
+            update_title
+            or update_description
+            or update_language
+            or update_testcases
+            or update_tags
         ):
             self.show_warning("No changes made.")
             return None, None, None, None, None
@@ -349,6 +407,8 @@ class ChallengeView:
         Returns:
             Test cases string or None if cancelled/empty
         """
+        import questionary
+
         testcases = questionary.text(
             "Enter test cases (format as needed/imports aren't necessary):"
         ).ask()
@@ -369,6 +429,8 @@ class ChallengeView:
         Returns:
             True if confirmed, False otherwise
         """
+        import questionary
+
         return questionary.confirm(
             f"Are you sure you want to delete this challenge? This action cannot be undone.\n"
             f"Challenge: {challenge.title}"
@@ -384,152 +446,138 @@ class ChallengeView:
         Returns:
             Sanitized folder name
         """
-        sanitized_name = re.sub(r"[^a-zA-Z0-9\s]", "", title)
-        sanitized_name = re.sub(r"\s+", "_", sanitized_name)
-        return sanitized_name.lower()
+        return _UNDERSCORE_RUN_RE.sub(
+            "_", title.translate(_FOLDER_NAME_TABLE)
+        ).strip("_")
 
-    def _setup_python_files(
-        self, challenge: Challenge, folder_name: str
-    ) -> str:
+    def _setup_python_files(self, challenge: Challenge, folder: Path) -> Path:
         """
         Set up Python challenge files.
 
         Args:
             challenge: Challenge object
-            folder_name: Name of the folder
+            folder: Workspace folder
 
         Returns:
             Path to the main challenge file
         """
-        challenge_path = os.path.join(folder_name, "challenge.py")
-        with open(challenge_path, "w", encoding="utf-8") as challenge_file:
-            challenge_file.write(
-                f'"""\n'
-                f"Title: {challenge.title}\n\n"
-                f"Description:\n{challenge.description}\n"
-                f'"""\n\n\n'
-                f"def {folder_name}():\n"
-                f"    # Write your solution here...\n"
-                f"    pass\n"
-            )
+        folder_name = folder.name
+        challenge_path = folder / "challenge.py"
+        challenge_path.write_text(
+            PYTHON_CHALLENGE_FILE_TEMPLATE.format(
+                title=challenge.title,
+                description=challenge.description,
+                function_name=folder_name,
+            ),
+            encoding="utf-8",
+        )
 
         if challenge.testcases:
-            test_path = os.path.join(folder_name, "test_challenge.py")
-            with open(test_path, "w", encoding="utf-8") as test_file:
-                imports = (
-                    f"import pytest\n\nfrom challenge import {folder_name}\n"
-                )
-                test_file.write(imports)
-                test_file.write(challenge.testcases)
+            imports = f"import pytest\n\nfrom challenge import {folder_name}\n"
+            (folder / "test_challenge.py").write_text(
+                imports + challenge.testcases, encoding="utf-8"
+            )
 
         return challenge_path
 
     def _setup_javascript_files(
-        self, challenge: Challenge, folder_name: str
-    ) -> str:
+        self, challenge: Challenge, folder: Path
+    ) -> Path:
         """
         Set up JavaScript challenge files.
 
         Args:
             challenge: Challenge object
-            folder_name: Name of the folder
+            folder: Workspace folder
 
         Returns:
             Path to the main challenge file
         """
-        function_name = "".join(
-            word.capitalize() if i > 0 else word
-            for i, word in enumerate(folder_name.split("_"))
+        # Folder names are already lowercase, so upper-casing the first
+        # letter of each later word is enough to get camelCase.
+        first, *rest = folder.name.split("_")
+        function_name = first + "".join(w[:1].upper() + w[1:] for w in rest)
+
+        challenge_path = folder / "challenge.js"
+        challenge_path.write_text(
+            JAVASCRIPT_CHALLENGE_FILE_TEMPLATE.format(
+                title=challenge.title,
+                description=challenge.description,
+                function_name=function_name,
+            ),
+            encoding="utf-8",
         )
 
-        challenge_path = os.path.join(folder_name, "challenge.js")
-        with open(challenge_path, "w", encoding="utf-8") as challenge_file:
-            challenge_file.write(
-                f"/*\n"
-                f"Title: {challenge.title}\n\n"
-                f"Description:\n{challenge.description}\n"
-                f"*/\n\n"
-                f"function {function_name}() {{\n"
-                f"    // write your solution here...\n"
-                f"}}\n\n"
-                f"module.exports = {function_name};"
-            )
-
         if challenge.testcases:
-            test_path = os.path.join(folder_name, "challenge.test.js")
-            with open(test_path, "w", encoding="utf-8") as test_file:
-                test_file.write(
-                    f"const {function_name} = require('./challenge');\n\n"
-                    f"{challenge.testcases}\n"
-                )
+            (folder / "challenge.test.js").write_text(
+                f"const {function_name} = require('./challenge');\n\n"
+                f"{challenge.testcases}\n",
+                encoding="utf-8",
+            )
 
         return challenge_path
 
-    def _setup_golang_files(
-        self, challenge: Challenge, folder_name: str
-    ) -> str:
+    def _setup_golang_files(self, challenge: Challenge, folder: Path) -> Path:
         """
         Set up Go challenge files.
 
         Args:
             challenge: Challenge object
-            folder_name: Name of the folder
+            folder: Workspace folder
 
         Returns:
             Path to the main challenge file
         """
+        import subprocess
+
         function_name = "".join(
-            word.capitalize() for word in folder_name.split("_")
+            word.capitalize() for word in folder.name.split("_")
         )
 
         # Initialize go module
         subprocess.run(
             ["go", "mod", "init", "challenge"],
-            cwd=folder_name,
+            cwd=folder,
             capture_output=True,
         )
 
         # Create challenge.go
-        challenge_path = os.path.join(folder_name, "challenge.go")
-        with open(challenge_path, "w", encoding="utf-8") as challenge_file:
-            challenge_file.write(
-                f"package main\n\n"
-                f"/*\n"
-                f"Title: {challenge.title}\n\n"
-                f"Description:\n{challenge.description}\n"
-                f"*/\n\n"
-                f"func {function_name}() {{\n"
-                f"\t// Write your solution here...\n"
-                f"}}\n"
-            )
+        challenge_path = folder / "challenge.go"
+        challenge_path.write_text(
+            GO_CHALLENGE_FILE_TEMPLATE.format(
+                title=challenge.title,
+                description=challenge.description,
+                function_name=function_name,
+            ),
+            encoding="utf-8",
+        )
 
         # Create test file if testcases provided
         if challenge.testcases:
-            test_path = os.path.join(folder_name, "challenge_test.go")
-            with open(test_path, "w", encoding="utf-8") as test_file:
-                test_file.write(
-                    f'package main\n\n'
-                    f'import "testing"\n\n'
-                    f'{challenge.testcases}\n'
-                )
+            (folder / "challenge_test.go").write_text(
+                f'package main\n\n'
+                f'import "testing"\n\n'
+                f'{challenge.testcases}\n',
+                encoding="utf-8",
+            )
 
         return challenge_path
 
     def show_success(self, message: str) -> None:
         """Display success message."""
-        self.console.print(f"[bold green]{message}[/bold green]")
+        self.console.print(message, style="bold green")
 
     def show_error(self, message: str) -> None:
         """Display error message."""
-        self.console.print(f"[bold red]{message}[/bold red]")
+        self.console.print(message, style="bold red")
 
     def show_warning(self, message: str) -> None:
         """Display warning message."""
-        self.console.print(f"[bold yellow]{message}[/bold yellow]")
+        self.console.print(message, style="bold yellow")
 
     def show_info(self, message: str) -> None:
         """Display info message."""
-        self.console.print(f"[bold cyan]{message}[/bold cyan]")
+        self.console.print(message, style="bold cyan")
 
     def show_challenge_added(self, challenge: Challenge) -> None:
         """Show confirmation that challenge was added successfully."""
@@ -566,6 +614,8 @@ class ChallengeView:
         Returns:
             Context manager for the spinner status.
         """
+        from rich.rule import Rule
+
         self.console.print()
         self.console.print()
         self.console.print(Rule("[bold cyan]Evaluation[/bold cyan]"))
@@ -589,6 +639,9 @@ class ChallengeView:
             evaluation: Parsed evaluation response
             iteration: Current iteration number
         """
+        from rich.markdown import Markdown
+        from rich.panel import Panel
+
         if iteration == 1:
             title = "Initial Evaluation"
         else:
@@ -628,6 +681,8 @@ class ChallengeView:
         Returns:
             Selected user action
         """
+        import questionary
+
         self.console.print(
             f"\n[dim]Note: SM-2 will use grade {first_grade:.2f} "
             "(from first evaluation)[/dim]"
@@ -658,6 +713,8 @@ class ChallengeView:
         Returns:
             User's dispute reason or None if cancelled
         """
+        import questionary
+
         reason = questionary.text(
             "Explain why you disagree with the evaluation:",
             multiline=True,
@@ -680,6 +737,8 @@ class ChallengeView:
         Returns:
             True if user wants clipboard fallback
         """
+        import questionary
+
         return questionary.confirm(
             "Would you like to use the clipboard method instead?",
             default=True,
@@ -0,0 +1,64 @@
+"""
+Shared rich console for the view layer.
+"""
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+_CLIPBOARD_TIMEOUT = 5.0
+
+
+@lru_cache(maxsize=None)
+def get_console() -> "Console":
+    """Return the shared default console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@lru_cache(maxsize=None)
+def styled_label(text: str, style: str = "bold cyan") -> "Text":
+    """
+    Return a cached rich Text for a fixed, styled label.
+
+    Printing a prebuilt Text skips markup parsing for the label; the
+    object is built on first use so rich is still imported lazily.
+    """
+    from rich.text import Text
+
+    return Text(text, style=style)
+
+
+def copy_in_background(text: str) -> Callable[[], Optional[Exception]]:
+    """
+    Start copying text to the clipboard on a daemon thread.
+
+    pyperclip shells out to xclip/xsel on Linux, so the copy runs while
+    the caller prints. The returned function waits for it and returns
+    None on success, TimeoutError if it did not finish in time, or the
+    exception raised by the copy.
+    """
+    import pyperclip
+
+    copy_errors: List[Exception] = []
+
+    def copy_text() -> None:
+        try:
+            pyperclip.copy(text)
+        except Exception as e:
+            copy_errors.append(e)
+
+    copier = threading.Thread(target=copy_text, daemon=True)
+    copier.start()
+
+    def wait() -> Optional[Exception]:
+        copier.join(timeout=_CLIPBOARD_TIMEOUT)
+        if copier.is_alive():
+            return TimeoutError("Clipboard copy timed out")
+        return copy_errors[0] if copy_errors else None
+
+    return wait
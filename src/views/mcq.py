@@ -1,10 +1,22 @@
-import random
-from typing import List, Optional, Tuple
-
-import questionary
-from rich.console import Console
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.models.mcq import MCQQuestion
+from src.views.console import get_console, styled_label
+from src.views.pagination import select_paginated
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.text import Text
+
+_DISPLAY_LETTERS = "abcd"
+_MISCONCEPTION_NOTE = (
+    "⚠️  High confidence with wrong answer detected - applying enhanced "
+    "penalty to combat misconception."
+)
+_UNCERTAIN_NOTE = (
+    "ℹ️  Correct but uncertain - will progress conservatively to build "
+    "confidence."
+)
 
 
 class MCQView:
@@ -13,8 +25,8 @@ class MCQView:
     Handles all user interface interactions for MCQ questions.
     """
 
-    def __init__(self, console: Console = None):
-        self.console = console or Console()
+    def __init__(self, console: "Console" = None):
+        self.console = console or get_console()
 
     def prompt_new_mcq_question(self) -> Optional[MCQQuestion]:
         """
@@ -23,6 +35,8 @@ class MCQView:
         Returns:
             MCQQuestion object with user input, or None if cancelled
         """
+        import questionary
+
         question = questionary.text("Enter the question:").ask()
         if not question:
             self.show_error("Question cannot be empty.")
@@ -53,19 +67,23 @@ class MCQView:
         Returns:
             MCQQuestion object or None if cancelled
         """
+        import questionary
+
         option_a = "True"
         option_b = "False"
 
         correct_option = questionary.select(
-            "Which is the correct answer?", choices=["a (True)", "b (False)"]
+            "Which is the correct answer?",
+            choices=[
+                questionary.Choice(title="a (True)", value="a"),
+                questionary.Choice(title="b (False)", value="b"),
+            ],
         ).ask()
 
         if not correct_option:
             self.show_warning("No correct option selected.")
             return None
 
-        correct_option = correct_option[0]
-
         self.console.print(
             "\n[bold cyan]Now let's add explanations for each option:[/bold cyan]"
         )
@@ -112,51 +130,43 @@ class MCQView:
         Returns:
             MCQQuestion object or None if cancelled
         """
+        import questionary
+
         option_a = questionary.text("Enter option A:").ask()
         option_b = questionary.text("Enter option B:").ask()
         option_c = questionary.text("Enter option C:").ask()
         option_d = questionary.text("Enter option D:").ask()
 
-        if not all([option_a, option_b, option_c, option_d]):
+        if not (option_a and option_b and option_c and option_d):
             self.show_error("All four options are required for MCQ questions.")
             return None
 
+        options = {"a": option_a, "b": option_b, "c": option_c, "d": option_d}
         choices = [
-            f"a) {option_a}",
-            f"b) {option_b}",
-            f"c) {option_c}",
-            f"d) {option_d}",
+            questionary.Choice(title=f"{letter}) {text}", value=letter)
+            for letter, text in options.items()
         ]
 
-        correct_choice = questionary.select(
+        correct_option = questionary.select(
             "Which option is correct?", choices=choices
         ).ask()
 
-        if not correct_choice:
+        if not correct_option:
             self.show_warning("No correct option selected.")
             return None
 
-        correct_option = correct_choice[0]
-
         self.console.print(
             "\n[bold cyan]Now let's add explanations for each option:[/bold cyan]"
         )
 
-        explanation_a = questionary.text(
-            f"Explain option A ({option_a}) - {'CORRECT' if correct_option == 'a' else 'Why it is wrong'}:"
-        ).ask()
-
-        explanation_b = questionary.text(
-            f"Explain option B ({option_b}) - {'CORRECT' if correct_option == 'b' else 'Why it is wrong'}:"
-        ).ask()
-
-        explanation_c = questionary.text(
-            f"Explain option C ({option_c}) - {'CORRECT' if correct_option == 'c' else 'Why it is wrong'}:"
-        ).ask()
-
-        explanation_d = questionary.text(
-            f"Explain option D ({option_d}) - {'CORRECT' if correct_option == 'd' else 'Why it is wrong'}:"
-        ).ask()
+        explanations = {}
+        for letter, text in options.items():
+            verdict = (
+                "CORRECT" if letter == correct_option else "Why it is wrong"
+            )
+            explanations[letter] = questionary.text(
+                f"Explain option {letter.upper()} ({text}) - {verdict}:"
+            ).ask()
 
         tags = questionary.text(
             "Enter tags (comma-separated, optional):"
@@ -172,10 +182,10 @@ class MCQView:
             option_c=option_c,
             option_d=option_d,
             correct_option=correct_option,
-            explanation_a=explanation_a,
-            explanation_b=explanation_b,
-            explanation_c=explanation_c,
-            explanation_d=explanation_d,
+            explanation_a=explanations["a"],
+            explanation_b=explanations["b"],
+            explanation_c=explanations["c"],
+            explanation_d=explanations["d"],
             tags=tags,
         )
 
@@ -183,6 +193,7 @@ class MCQView:
         self,
         mcq_questions: List[MCQQuestion],
         title: str = "Select an MCQ question:",
+        page_size: int = 50,
     ) -> Optional[MCQQuestion]:
         """
         Display list of MCQ questions for user selection.
@@ -190,6 +201,7 @@ class MCQView:
         Args:
             mcq_questions: List of MCQ questions to choose from
             title: Selection prompt title
+            page_size: Lists longer than this are shown one page at a time
 
         Returns:
             Selected MCQ question or None if cancelled
@@ -198,19 +210,19 @@ class MCQView:
             self.show_info("No MCQ questions available.")
             return None
 
-        question_choices = [
-            f"ID: {q.id} - {q.question} (Type: {q.question_type})"
-            for q in mcq_questions
-        ]
-
-        selected = questionary.select(title, choices=question_choices).ask()
-        if not selected:
+        selected = select_paginated(
+            title,
+            mcq_questions,
+            lambda q: (
+                f"ID: {q.id} - {q.question} (Type: {q.question_type})"
+            ),
+            page_size,
+        )
+        if selected is None:
             self.show_warning("No MCQ question selected.")
             return None
 
-        # Extract ID from selection
-        selected_id = int(selected.split(":")[1].strip().split(" ")[0])
-        return next(q for q in mcq_questions if q.id == selected_id)
+        return selected
 
     def show_due_mcq_questions(self, mcq_questions: List[MCQQuestion]) -> None:
         """
@@ -223,14 +235,15 @@ class MCQView:
             self.show_success("No MCQ questions are due for review today!")
             return
 
-        self.console.print(
+        lines = [
             "[bold cyan]MCQ Questions due for review (sorted by priority):[/bold cyan]"
-        )
+        ]
         for mcq_question in mcq_questions:
-            self.console.print(
+            lines.append(
                 f"[bold yellow]ID {mcq_question.id}[/bold yellow]: "
                 f"{mcq_question.question} (Type: {mcq_question.question_type})"
             )
+        self.console.print("\n".join(lines))
 
     def show_all_mcq_questions(self, mcq_questions: List[MCQQuestion]) -> None:
         """
@@ -239,20 +252,33 @@ class MCQView:
         Args:
             mcq_questions: List of MCQ questions to display
         """
+        from rich.table import Table
+
         if not mcq_questions:
             self.show_success("No MCQ questions in the database yet!")
             return
 
-        self.console.print("[bold cyan]All MCQ Questions:[/bold cyan]")
+        table = Table(
+            title="All MCQ Questions",
+            title_style="bold cyan",
+            title_justify="left",
+        )
+        table.add_column("ID", style="bold yellow", justify="right")
+        table.add_column("Question")
+        table.add_column("Type")
+        table.add_column("Tags")
+        table.add_column("Interval", justify="right")
+        table.add_column("Last Reviewed")
         for mcq_question in mcq_questions:
-            self.console.print(
-                f"[bold yellow]ID {mcq_question.id}[/bold yellow]: "
-                f"{mcq_question.question} "
-                f"(Type: {mcq_question.question_type}, "
-                f"Tags: {mcq_question.tags or 'None'}, "
-                f"Interval: {mcq_question.interval}, "
-                f"Last Reviewed: {mcq_question.last_reviewed or 'Never'})"
+            table.add_row(
+                str(mcq_question.id),
+                mcq_question.question,
+                mcq_question.question_type,
+                mcq_question.tags or "None",
+                str(mcq_question.interval),
+                str(mcq_question.last_reviewed or "Never"),
             )
+        self.console.print(table)
 
     def display_mcq_question_for_review(
         self,
@@ -269,40 +295,49 @@ class MCQView:
         Returns:
             Tuple of (user_choice_original_letter, confidence_level) or (None, None) if cancelled
         """
+        import random
+
+        import questionary
+
         self.console.print(
-            f"\n[bold cyan]Question:[/bold cyan] {mcq_question.question}"
+            styled_label("\nQuestion:"), mcq_question.question
         )
         self.console.print(
-            f"[bold cyan]Type:[/bold cyan] {mcq_question.question_type}"
+            styled_label("Type:"), mcq_question.question_type
         )
         if mcq_question.tags:
             self.console.print(
-                f"[bold cyan]Tags:[/bold cyan] {mcq_question.tags}"
+                styled_label("Tags:"), mcq_question.tags
             )
 
-        randomized_options = available_options.copy()
-        random.shuffle(randomized_options)
-        self.console.print("\n[bold yellow]Options:[/bold yellow]")
+        randomized_options = random.sample(
+            available_options, len(available_options)
+        )
         display_choices = []
-        option_mapping = {}
 
-        for i, (original_letter, option_text) in enumerate(randomized_options):
-            display_letter = chr(ord("a") + i)  # a, b, c, d for display
-            option_mapping[display_letter] = original_letter
-            self.console.print(f"  {display_letter}) {option_text}")
-            display_choices.append(f"{display_letter}) {option_text}")
+        for display_letter, (original_letter, option_text) in zip(
+            _DISPLAY_LETTERS, randomized_options
+        ):
+            display_choices.append(
+                questionary.Choice(
+                    title=f"{display_letter}) {option_text}",
+                    value=original_letter,
+                )
+            )
 
-        user_choice = questionary.select(
+        self.console.print(
+            "\n[bold yellow]Options:[/bold yellow]\n"
+            + "\n".join(f"  {choice.title}" for choice in display_choices)
+        )
+
+        user_answer_original = questionary.select(
             "\nWhat is your answer?", choices=display_choices
         ).ask()
 
-        if not user_choice:
+        if not user_answer_original:
             self.show_warning("No answer selected.")
             return None, None
 
-        user_answer_display = user_choice[0]
-        user_answer_original = option_mapping[user_answer_display]
-
         confidence = questionary.select(
             "How confident are you in your answer?",
             choices=["low", "medium", "high"],
@@ -334,18 +369,23 @@ class MCQView:
             get_option_text_func: Function to get option text
             get_explanation_func: Function to get explanation
         """
-        self.console.print(f"\n[bold cyan]=== FEEDBACK ===[/bold cyan]")
+        from rich.console import Group
+        from rich.text import Text
+
+        parts = [Text.assemble("\n", styled_label("=== FEEDBACK ==="))]
 
         user_option_text = get_option_text_func(mcq_question, user_choice)
         user_explanation = get_explanation_func(mcq_question, user_choice)
 
         if user_explanation:
-            self._display_explanation(
-                user_choice,
-                user_option_text,
-                user_explanation,
-                is_correct,
-                True,
+            parts.append(
+                self._format_explanation(
+                    user_choice,
+                    user_option_text,
+                    user_explanation,
+                    is_correct,
+                    True,
+                )
             )
 
         if not is_correct:
@@ -357,37 +397,39 @@ class MCQView:
             )
 
             if correct_explanation:
-                self._display_explanation(
-                    mcq_question.correct_option,
-                    correct_option_text,
-                    correct_explanation,
-                    True,
-                    False,
+                parts.append(
+                    self._format_explanation(
+                        mcq_question.correct_option,
+                        correct_option_text,
+                        correct_explanation,
+                        True,
+                        False,
+                    )
                 )
 
-        self.console.print(
-            f"\n[bold cyan]Your confidence:[/bold cyan] {confidence}"
+        parts.append(
+            Text.assemble(
+                "\n", styled_label("Your confidence:"), " ", confidence
+            )
         )
 
         if not is_correct and confidence == "high":
-            self.show_warning(
-                "⚠️  High confidence with wrong answer detected - applying enhanced penalty to combat misconception."
-            )
+            parts.append(styled_label(_MISCONCEPTION_NOTE, "bold yellow"))
         elif is_correct and confidence == "low":
-            self.show_info(
-                "ℹ️  Correct but uncertain - will progress conservatively to build confidence."
-            )
+            parts.append(styled_label(_UNCERTAIN_NOTE))
 
-    def _display_explanation(
+        self.console.print(Group(*parts))
+
+    def _format_explanation(
         self,
         option_letter: str,
         option_text: str,
         explanation: str,
         is_correct: bool,
         is_user_choice: bool,
-    ) -> None:
+    ) -> "Text":
         """
-        Helper function to display explanations with appropriate formatting.
+        Helper function to build an explanation block with its styling.
 
         Args:
             option_letter: The option letter
@@ -395,29 +437,27 @@ class MCQView:
             explanation: The explanation text
             is_correct: Whether this option is correct
             is_user_choice: Whether this was the user's choice
+
+        Returns:
+            Styled Text for the explanation block
         """
-        if is_user_choice:
-            if is_correct:
-                self.console.print(
-                    f"\n[bold green]✓ Your choice: {option_letter.upper()}) {option_text}[/bold green]"
-                )
-                self.console.print(
-                    f"[bold green]Why this is correct:[/bold green] {explanation}"
-                )
-            else:
-                self.console.print(
-                    f"\n[bold red]✗ Your choice: {option_letter.upper()}) {option_text}[/bold red]"
-                )
-                self.console.print(
-                    f"[bold red]Why this is wrong:[/bold red] {explanation}"
-                )
-        elif is_correct and not is_user_choice:
-            self.console.print(
-                f"\n[bold cyan]✓ Correct answer: {option_letter.upper()}) {option_text}[/bold cyan]"
-            )
-            self.console.print(
-                f"[bold cyan]Why this is correct:[/bold cyan] {explanation}"
-            )
+        from rich.text import Text
+
+        if is_user_choice and is_correct:
+            style, heading, reason = "bold green", "✓ Your choice", "correct"
+        elif is_user_choice:
+            style, heading, reason = "bold red", "✗ Your choice", "wrong"
+        else:
+            style, heading, reason = "bold cyan", "✓ Correct answer", "correct"
+
+        return Text.assemble(
+            "\n",
+            (f"{heading}: {option_letter.upper()}) {option_text}", style),
+            "\n",
+            styled_label(f"Why this is {reason}:", style),
+            " ",
+            explanation,
+        )
 
     def prompt_continue_review(self) -> bool:
         """
@@ -426,6 +466,8 @@ class MCQView:
         Returns:
             True if user wants to continue, False otherwise
         """
+        import questionary
+
         return questionary.confirm("Review another MCQ question?").ask()
 
     def prompt_update_fields(
@@ -440,14 +482,16 @@ class MCQView:
         Returns:
             Tuple of (new_question_text, new_tags) or (None, None) if no updates
         """
+        import questionary
+
         self.console.print(
-            f"[bold cyan]Current question:[/bold cyan] {mcq_question.question}"
+            styled_label("Current question:"), mcq_question.question
         )
         self.console.print(
-            f"[bold cyan]Current type:[/bold cyan] {mcq_question.question_type}"
+            styled_label("Current type:"), mcq_question.question_type
         )
         self.console.print(
-            f"[bold cyan]Current tags:[/bold cyan] {mcq_question.tags or 'None'}"
+            styled_label("Current tags:"), mcq_question.tags or "None"
         )
 
         update_question = questionary.confirm(
@@ -485,6 +529,8 @@ class MCQView:
         Returns:
             True if confirmed, False otherwise
         """
+        import questionary
+
         return questionary.confirm(
             f"Are you sure you want to delete this MCQ question? This action cannot be undone.\n"
             f"Question: {mcq_question.question}"
@@ -510,17 +556,18 @@ class MCQView:
         """Show confirmation that MCQ question was added successfully."""
         self.show_success("MCQ question added successfully!")
         self.console.print(
-            f"[bold cyan]Question:[/bold cyan] {mcq_question.question}"
+            styled_label("Question:"), mcq_question.question
         )
         self.console.print(
-            f"[bold cyan]Type:[/bold cyan] {mcq_question.question_type}"
+            styled_label("Type:"), mcq_question.question_type
         )
         self.console.print(
-            f"[bold cyan]Correct answer:[/bold cyan] {mcq_question.correct_option.upper()}"
+            styled_label("Correct answer:"),
+            mcq_question.correct_option.upper(),
         )
         if mcq_question.tags:
             self.console.print(
-                f"[bold cyan]Tags:[/bold cyan] {mcq_question.tags}"
+                styled_label("Tags:"), mcq_question.tags
             )
 
     def show_mcq_question_updated(self, mcq_question: MCQQuestion) -> None:
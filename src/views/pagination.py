@@ -0,0 +1,73 @@
+"""
+Paginated selection prompt for long lists of items.
+"""
+from typing import Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+_PREVIOUS_PAGE = object()
+_NEXT_PAGE = object()
+
+
+def select_paginated(
+    title: str,
+    items: List[T],
+    label: Callable[[T], str],
+    page_size: int = 50,
+) -> Optional[T]:
+    """
+    Let the user pick an item while showing at most page_size at a time.
+
+    Labels are only built for the page being displayed; "Previous page"
+    and "Next page" entries move between pages. A list that fits on one
+    page is shown as a plain select.
+
+    Args:
+        title: Selection prompt title
+        items: Items to choose from
+        label: Function returning the display label for an item
+        page_size: Maximum number of items shown per page
+
+    Returns:
+        Selected item or None if cancelled
+
+    Raises:
+        ValueError: If page_size is less than 1
+    """
+    import questionary
+
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    page_count = max(1, -(-len(items) // page_size))
+    page = 0
+
+    while True:
+        start = page * page_size
+        choices = [
+            questionary.Choice(title=label(item), value=item)
+            for item in items[start : start + page_size]
+        ]
+        if page > 0:
+            choices.append(
+                questionary.Choice(
+                    title="<< Previous page", value=_PREVIOUS_PAGE
+                )
+            )
+        if page < page_count - 1:
+            choices.append(
+                questionary.Choice(title="Next page >>", value=_NEXT_PAGE)
+            )
+
+        if page_count > 1:
+            prompt = f"{title} (page {page + 1}/{page_count})"
+        else:
+            prompt = title
+        selected = questionary.select(prompt, choices=choices).ask()
+
+        if selected is _PREVIOUS_PAGE:
+            page -= 1
+        elif selected is _NEXT_PAGE:
+            page += 1
+        else:
+            return selected
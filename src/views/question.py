@@ -1,13 +1,20 @@
 import os
+import shlex
 import tempfile
-from typing import List, Optional, Tuple
-
-import pyperclip
-import questionary
-from rich.console import Console
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from src.models.question import Question
 from src.templates import QUESTION_PROMPT_TEMPLATE
+from src.views.console import copy_in_background, get_console, styled_label
+from src.views.pagination import select_paginated
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Split the template around its two placeholders once so building a
+# prompt is plain concatenation instead of a str.format parse per call.
+_PROMPT_HEAD, _PROMPT_REST = QUESTION_PROMPT_TEMPLATE.split("{question}")
+_PROMPT_MIDDLE, _PROMPT_TAIL = _PROMPT_REST.split("{answer}")
 
 
 class QuestionView:
@@ -16,8 +23,8 @@ class QuestionView:
     Handles all user interface interactions for questions.
     """
 
-    def __init__(self, console: Console = None):
-        self.console = console or Console()
+    def __init__(self, console: "Console" = None):
+        self.console = console or get_console()
 
     def prompt_new_question(self) -> Optional[Question]:
         """
@@ -26,6 +33,8 @@ class QuestionView:
         Returns:
             Question object with user input, or None if cancelled
         """
+        import questionary
+
         question_text = questionary.text("Enter the question:").ask()
         if not question_text:
             self.show_error("Question cannot be empty.")
@@ -40,7 +49,10 @@ class QuestionView:
         return Question(question_text=question_text.strip(), tags=tags)
 
     def prompt_question_selection(
-        self, questions: List[Question], title: str = "Select a question:"
+        self,
+        questions: List[Question],
+        title: str = "Select a question:",
+        page_size: int = 50,
     ) -> Optional[Question]:
         """
         Display list of questions for user selection.
@@ -48,6 +60,7 @@ class QuestionView:
         Args:
             questions: List of questions to choose from
             title: Selection prompt title
+            page_size: Lists longer than this are shown one page at a time
 
         Returns:
             Selected question or None if cancelled
@@ -56,17 +69,17 @@ class QuestionView:
             self.show_info("No questions available.")
             return None
 
-        question_choices = [
-            f"ID: {q.id} - {q.question_text}" for q in questions
-        ]
-
-        selected = questionary.select(title, choices=question_choices).ask()
-        if not selected:
+        selected = select_paginated(
+            title,
+            questions,
+            lambda q: f"ID: {q.id} - {q.question_text}",
+            page_size,
+        )
+        if selected is None:
             self.show_warning("No question selected.")
             return None
 
-        selected_id = int(selected.split(":")[1].strip().split(" ")[0])
-        return next(q for q in questions if q.id == selected_id)
+        return selected
 
     def show_due_questions(self, questions: List[Question]) -> None:
         """
@@ -79,12 +92,13 @@ class QuestionView:
             self.show_success("No questions are due for review today!")
             return
 
-        self.console.print("[bold cyan]Questions due for review:[/bold cyan]")
+        lines = ["[bold cyan]Questions due for review:[/bold cyan]"]
         for question in questions:
-            self.console.print(
+            lines.append(
                 f"[bold yellow]ID {question.id}[/bold yellow]: "
                 f"{question.question_text}"
             )
+        self.console.print("\n".join(lines))
 
     def show_all_questions(self, questions: List[Question]) -> None:
         """
@@ -93,19 +107,31 @@ class QuestionView:
         Args:
             questions: List of questions to display
         """
+        from rich.table import Table
+
         if not questions:
             self.show_success("No questions in the database yet!")
             return
 
-        self.console.print("[bold cyan]All Questions:[/bold cyan]")
+        table = Table(
+            title="All Questions",
+            title_style="bold cyan",
+            title_justify="left",
+        )
+        table.add_column("ID", style="bold yellow", justify="right")
+        table.add_column("Question")
+        table.add_column("Tags")
+        table.add_column("Interval", justify="right")
+        table.add_column("Last Reviewed")
         for question in questions:
-            self.console.print(
-                f"[bold yellow]ID {question.id}[/bold yellow]: "
-                f"{question.question_text} "
-                f"(Tags: {question.tags or 'None'}, "
-                f"Interval: {question.interval}, "
-                f"Last Reviewed: {question.last_reviewed or 'Never'})"
+            table.add_row(
+                str(question.id),
+                question.question_text,
+                question.tags or "None",
+                str(question.interval),
+                str(question.last_reviewed or "Never"),
             )
+        self.console.print(table)
 
     def prompt_answer_in_editor(self, question: Question) -> Tuple[str, str]:
         """
@@ -117,23 +143,25 @@ class QuestionView:
         Returns:
             Tuple of (question_text, answer_text)
         """
-        with tempfile.NamedTemporaryFile(
-            suffix=".txt", delete=False
-        ) as temp_file:
-            temp_file.write(
-                f"Question: {question.question_text}\n\n".encode("utf-8")
-            )
-            temp_path = temp_file.name
+        import subprocess
+
+        editor = shlex.split(os.getenv("EDITOR", "nvim"))
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = os.path.join(temp_dir, "answer.txt")
+            with open(temp_path, "w", encoding="utf-8") as temp_file:
+                temp_file.write(f"Question: {question.question_text}\n\n")
 
-        os.system(f"{os.getenv('EDITOR', 'nvim')} {temp_path}")
+            subprocess.run([*editor, temp_path], check=False)
 
-        with open(temp_path, "r", encoding="utf-8") as f:
-            content = f.read().strip()
-        os.unlink(temp_path)
+            # Line 1 is the question header, line 2 the separator written
+            # above; everything after that is the answer.
+            with open(temp_path, "r", encoding="utf-8") as f:
+                question_line = f.readline()
+                f.readline()
+                answer_text = f.read().strip()
 
-        lines = content.split("\n")
-        question_text = lines[0].replace("Question: ", "").strip()
-        answer_text = "\n".join(lines[2:]).strip()
+        question_text = question_line.removeprefix("Question: ").strip()
 
         return question_text, answer_text
 
@@ -151,15 +179,26 @@ class QuestionView:
         Returns:
             The generated prompt
         """
-        prompt = QUESTION_PROMPT_TEMPLATE.format(
-            question=question_text, answer=answer_text
+        prompt = (
+            _PROMPT_HEAD
+            + question_text
+            + _PROMPT_MIDDLE
+            + answer_text
+            + _PROMPT_TAIL
         )
 
-        pyperclip.copy(prompt)
+        wait_for_copy = copy_in_background(prompt)
 
         self.console.print("[bold cyan]Evaluation Prompt:[/bold cyan]\n")
         self.console.print(prompt.strip())
-        self.show_success("Prompt copied to clipboard!")
+
+        copy_error = wait_for_copy()
+        if isinstance(copy_error, TimeoutError):
+            self.show_warning(str(copy_error))
+        elif copy_error:
+            self.show_error(f"Error copying prompt: {copy_error}")
+        else:
+            self.show_success("Prompt copied to clipboard!")
 
         return prompt
 
@@ -170,6 +209,8 @@ class QuestionView:
         Returns:
             Grade as float, or None if invalid/cancelled
         """
+        import questionary
+
         grade_input = questionary.text(
             "Enter the average grade (0-3) received:"
         ).ask()
@@ -202,11 +243,13 @@ class QuestionView:
         Returns:
             Tuple of (new_question_text, new_tags) or (None, None) if no updates
         """
+        import questionary
+
         self.console.print(
-            f"[bold cyan]Current question:[/bold cyan] {question.question_text}"
+            styled_label("Current question:"), question.question_text
         )
         self.console.print(
-            f"[bold cyan]Current tags:[/bold cyan] {question.tags or 'None'}"
+            styled_label("Current tags:"), question.tags or "None"
         )
 
         update_question = questionary.confirm(
@@ -244,6 +287,8 @@ class QuestionView:
         Returns:
             True if confirmed, False otherwise
         """
+        import questionary
+
         return questionary.confirm(
             f"Are you sure you want to delete this question? This action cannot be undone.\n"
             f"Question: {question.question_text}"
@@ -269,10 +314,10 @@ class QuestionView:
         """Show confirmation that question was added successfully."""
         self.show_success("Question added successfully!")
         self.console.print(
-            f"[bold cyan]Question:[/bold cyan] {question.question_text}"
+            styled_label("Question:"), question.question_text
         )
         if question.tags:
-            self.console.print(f"[bold cyan]Tags:[/bold cyan] {question.tags}")
+            self.console.print(styled_label("Tags:"), question.tags)
 
     def show_question_updated(self, question: Question) -> None:
         """Show confirmation that question was updated successfully."""
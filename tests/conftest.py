@@ -2,6 +2,7 @@
 
 import sqlite3
 from datetime import date, timedelta
+from pathlib import Path
 
 import pytest
 
@@ -9,74 +10,51 @@ from src.models.challenge import Challenge
 from src.models.mcq import MCQQuestion
 from src.models.question import Question
 
+_SCHEMA_SQL = (Path(__file__).parent / "schema.sql").read_text(
+    encoding="utf-8"
+)
+
+
+@pytest.fixture(scope="session")
+def _db_template(tmp_path_factory):
+    """Build the SQLite schema once into an on-disk template database."""
+    path = tmp_path_factory.mktemp("db") / "template.sqlite"
+    conn = sqlite3.connect(path)
+    # The template is throwaway, so skip journaling and fsync while writing.
+    conn.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;")
+    conn.executescript(_SCHEMA_SQL)
+    conn.close()
+    return path
+
 
 @pytest.fixture
-def test_db():
-    """Create an in-memory SQLite database for testing."""
+def test_db(_db_template):
+    """
+    Create an in-memory SQLite database for testing.
+
+    Rows come back as plain tuples, matching the repositories' positional
+    _row_to_* helpers; set row_factory in the test if it needs
+    name-indexed rows.
+    """
+    template = sqlite3.connect(_db_template)
     conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
-
-    cursor = conn.cursor()
-
-    # Create questions table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS questions (
-            id INTEGER PRIMARY KEY,
-            question TEXT NOT NULL,
-            tags TEXT,
-            last_reviewed DATE,
-            interval INTEGER DEFAULT 1,
-            ease_factor REAL DEFAULT 2.5
-        )
-    """)
-
-    # Create challenges table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS challenges (
-            id INTEGER PRIMARY KEY,
-            title TEXT NOT NULL,
-            description TEXT NOT NULL,
-            testcases TEXT,
-            language TEXT NOT NULL CHECK (language IN ('python', 'javascript')),
-            tags TEXT,
-            last_reviewed DATE DEFAULT CURRENT_DATE,
-            interval INTEGER DEFAULT 1,
-            ease_factor REAL DEFAULT 2.5
-        )
-    """)
-
-    # Create mcq_questions table
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS mcq_questions (
-            id INTEGER PRIMARY KEY,
-            question TEXT NOT NULL,
-            question_type TEXT DEFAULT 'mcq'
-                CHECK (question_type IN ('mcq', 'true_false')),
-            option_a TEXT NOT NULL,
-            option_b TEXT NOT NULL,
-            option_c TEXT,
-            option_d TEXT,
-            correct_option TEXT NOT NULL CHECK (correct_option IN ('a','b','c','d')),
-            explanation_a TEXT,
-            explanation_b TEXT,
-            explanation_c TEXT,
-            explanation_d TEXT,
-            tags TEXT,
-            last_reviewed DATE,
-            interval INTEGER DEFAULT 1,
-            ease_factor REAL DEFAULT 2.5
-        )
-    """)
-
-    conn.commit()
+    template.backup(conn)
+    template.close()
+
     yield conn
     conn.close()
 
 
-@pytest.fixture
-def sample_question():
+# The sample models below are built once per session with model_construct(),
+# which skips validation. Only use it for data that is known to be valid;
+# tests that exercise validation must call the model constructors directly.
+# Pydantic models are mutable, so tests receive a copy of the shared model.
+
+
+@pytest.fixture(scope="session")
+def _sample_question():
     """Create a sample Question model."""
-    return Question(
+    return Question.model_construct(
         question_text="What is the time complexity of binary search?",
         tags="algorithms, search",
         interval=1,
@@ -84,10 +62,10 @@ def sample_question():
     )
 
 
-@pytest.fixture
-def sample_challenge():
+@pytest.fixture(scope="session")
+def _sample_challenge():
     """Create a sample Challenge model."""
-    return Challenge(
+    return Challenge.model_construct(
         title="FizzBuzz",
         description="Write a function that prints FizzBuzz",
         language="python",
@@ -96,10 +74,10 @@ def sample_challenge():
     )
 
 
-@pytest.fixture
-def sample_mcq():
+@pytest.fixture(scope="session")
+def _sample_mcq():
     """Create a sample MCQ model."""
-    return MCQQuestion(
+    return MCQQuestion.model_construct(
         question="What is the output of print(2 ** 3)?",
         question_type="mcq",
         option_a="6",
@@ -115,10 +93,10 @@ def sample_mcq():
     )
 
 
-@pytest.fixture
-def sample_true_false():
+@pytest.fixture(scope="session")
+def _sample_true_false():
     """Create a sample True/False MCQ model."""
-    return MCQQuestion(
+    return MCQQuestion.model_construct(
         question="Python is a compiled language",
         question_type="true_false",
         option_a="True",
@@ -130,6 +108,49 @@ def sample_true_false():
     )
 
 
+@pytest.fixture
+def sample_question(_sample_question):
+    """Return a copy of the sample Question model."""
+    return _sample_question.model_copy()
+
+
+@pytest.fixture
+def sample_challenge(_sample_challenge):
+    """Return a copy of the sample Challenge model."""
+    return _sample_challenge.model_copy()
+
+
+@pytest.fixture
+def sample_mcq(_sample_mcq):
+    """Return a copy of the sample MCQ model."""
+    return _sample_mcq.model_copy()
+
+
+@pytest.fixture
+def sample_true_false(_sample_true_false):
+    """Return a copy of the sample True/False MCQ model."""
+    return _sample_true_false.model_copy()
+
+
+FROZEN_TODAY = date(2024, 1, 1)
+
+
+class FrozenDate(date):
+    """date subclass whose today() always returns FROZEN_TODAY."""
+
+    @classmethod
+    def today(cls):
+        return cls(FROZEN_TODAY.year, FROZEN_TODAY.month, FROZEN_TODAY.day)
+
+
+@pytest.fixture
+def frozen_today(monkeypatch):
+    """Freeze date.today() in the model modules and return the frozen date."""
+    monkeypatch.setattr("src.models.challenge.date", FrozenDate)
+    monkeypatch.setattr("src.models.mcq.date", FrozenDate)
+    return FROZEN_TODAY
+
+
 @pytest.fixture
 def today():
     """Return today's date."""
@@ -0,0 +1,40 @@
+CREATE TABLE IF NOT EXISTS questions (
+    id INTEGER PRIMARY KEY,
+    question TEXT NOT NULL,
+    tags TEXT,
+    last_reviewed DATE,
+    interval INTEGER DEFAULT 1,
+    ease_factor REAL DEFAULT 2.5
+);
+
+CREATE TABLE IF NOT EXISTS challenges (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    testcases TEXT,
+    language TEXT NOT NULL CHECK (language IN ('python', 'javascript')),
+    tags TEXT,
+    last_reviewed DATE DEFAULT CURRENT_DATE,
+    interval INTEGER DEFAULT 1,
+    ease_factor REAL DEFAULT 2.5
+);
+
+CREATE TABLE IF NOT EXISTS mcq_questions (
+    id INTEGER PRIMARY KEY,
+    question TEXT NOT NULL,
+    question_type TEXT DEFAULT 'mcq'
+        CHECK (question_type IN ('mcq', 'true_false')),
+    option_a TEXT NOT NULL,
+    option_b TEXT NOT NULL,
+    option_c TEXT,
+    option_d TEXT,
+    correct_option TEXT NOT NULL CHECK (correct_option IN ('a','b','c','d')),
+    explanation_a TEXT,
+    explanation_b TEXT,
+    explanation_c TEXT,
+    explanation_d TEXT,
+    tags TEXT,
+    last_reviewed DATE,
+    interval INTEGER DEFAULT 1,
+    ease_factor REAL DEFAULT 2.5
+);
@@ -0,0 +1,38 @@
+"""Model factory fixtures for the model tests."""
+
+import pytest
+
+from src.models.mcq import MCQQuestion
+from src.models.question import Question
+
+MCQ_BASE = {
+    "question": "Test",
+    "question_type": "mcq",
+    "option_a": "A",
+    "option_b": "B",
+    "option_c": "C",
+    "option_d": "D",
+    "correct_option": "a",
+}
+
+QUESTION_BASE = {"question_text": "Test"}
+
+
+@pytest.fixture
+def make_mcq():
+    """Return a factory validating a four-option MCQ with overrides."""
+
+    def make(**overrides):
+        return MCQQuestion.model_validate({**MCQ_BASE, **overrides})
+
+    return make
+
+
+@pytest.fixture
+def make_question():
+    """Return a factory validating a Question with overrides."""
+
+    def make(**overrides):
+        return Question.model_validate({**QUESTION_BASE, **overrides})
+
+    return make
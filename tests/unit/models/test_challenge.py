@@ -7,6 +7,12 @@ from pydantic import ValidationError
 
 from src.models.challenge import Challenge
 
+VALID_CHALLENGE_FIELDS = {
+    "title": "Test",
+    "description": "Description",
+    "language": "python",
+}
+
 
 class TestChallengeCreation:
     """Tests for Challenge model creation and validation."""
@@ -73,53 +79,37 @@ class TestChallengeCreation:
 class TestChallengeTitleDescription:
     """Tests for title and description validation."""
 
-    def test_empty_title_fails(self):
-        """Empty title should raise ValidationError."""
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("title", ""),
+            ("title", "   "),
+            ("description", ""),
+            ("description", "   "),
+        ],
+    )
+    def test_blank_required_field_fails(self, field, value):
+        """Blank title/description should raise ValidationError."""
         with pytest.raises(ValidationError):
-            Challenge(
-                title="", description="Valid description", language="python"
-            )
+            Challenge(**{**VALID_CHALLENGE_FIELDS, field: value})
 
-    def test_whitespace_only_title_fails(self):
-        """Whitespace-only title should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Challenge(
-                title="   ",
-                description="Valid description",
-                language="python",
-            )
 
-    def test_empty_description_fails(self):
-        """Empty description should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Challenge(
-                title="Valid Title", description="", language="python"
-            )
+class TestChallengeStripping:
+    """Tests for whitespace stripping of text fields."""
 
-    def test_whitespace_only_description_fails(self):
-        """Whitespace-only description should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Challenge(
-                title="Valid Title", description="   ", language="python"
-            )
-
-    def test_title_gets_stripped(self):
-        """Title should be stripped of whitespace."""
-        c = Challenge(
-            title="  FizzBuzz  ",
-            description="Description",
-            language="python",
-        )
-        assert c.title == "FizzBuzz"
-
-    def test_description_gets_stripped(self):
-        """Description should be stripped of whitespace."""
-        c = Challenge(
-            title="Title",
-            description="  Some description  ",
-            language="python",
-        )
-        assert c.description == "Some description"
+    @pytest.mark.parametrize(
+        "field,value,expected",
+        [
+            ("title", "  FizzBuzz  ", "FizzBuzz"),
+            ("description", "  Some description  ", "Some description"),
+            ("testcases", "  assert True  ", "assert True"),
+            ("tags", "  algorithms, python  ", "algorithms, python"),
+        ],
+    )
+    def test_field_gets_stripped(self, field, value, expected):
+        """Text fields should be stripped of surrounding whitespace."""
+        c = Challenge(**{**VALID_CHALLENGE_FIELDS, field: value})
+        assert getattr(c, field) == expected
 
 
 class TestChallengeTestcases:
@@ -128,73 +118,32 @@ class TestChallengeTestcases:
     def test_with_testcases(self):
         """Challenge can have testcases."""
         c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-            testcases="assert func(1) == 1",
+            **VALID_CHALLENGE_FIELDS, testcases="assert func(1) == 1"
         )
         assert c.testcases == "assert func(1) == 1"
 
     def test_without_testcases(self):
         """Testcases are optional."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-        )
+        c = Challenge(**VALID_CHALLENGE_FIELDS)
         assert c.testcases is None
 
-    def test_testcases_stripped(self):
-        """Testcases should be stripped of whitespace."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-            testcases="  assert True  ",
-        )
-        assert c.testcases == "assert True"
-
     def test_whitespace_only_testcases_becomes_none(self):
         """Whitespace-only testcases should become None."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-            testcases="   ",
-        )
+        c = Challenge(**VALID_CHALLENGE_FIELDS, testcases="   ")
         assert c.testcases is None
 
 
 class TestChallengeTags:
     """Tests for tag handling in Challenge model."""
 
-    def test_tags_normalization(self):
-        """Tags should be stripped."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-            tags="  algorithms, python  ",
-        )
-        assert c.tags == "algorithms, python"
-
     def test_tags_optional(self):
         """Tags are optional."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-        )
+        c = Challenge(**VALID_CHALLENGE_FIELDS)
         assert c.tags is None
 
     def test_whitespace_only_tags_becomes_none(self):
         """Whitespace-only tags should become None."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-            tags="   ",
-        )
+        c = Challenge(**VALID_CHALLENGE_FIELDS, tags="   ")
         assert c.tags is None
 
 
@@ -203,50 +152,27 @@ class TestChallengeSM2Fields:
 
     def test_default_sm2_values(self):
         """Default SM2 values should be set."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-        )
+        c = Challenge(**VALID_CHALLENGE_FIELDS)
         assert c.interval == 1
         assert c.ease_factor == 2.5
 
-    def test_default_last_reviewed_is_today(self):
+    def test_default_last_reviewed_is_today(self, frozen_today):
         """Default last_reviewed should be today's date."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-        )
-        assert c.last_reviewed == date.today()
+        c = Challenge(**VALID_CHALLENGE_FIELDS)
+        assert c.last_reviewed == frozen_today
 
     def test_interval_minimum_bound(self):
         """Interval must be at least 1."""
         with pytest.raises(ValidationError):
-            Challenge(
-                title="Test",
-                description="Description",
-                language="python",
-                interval=0,
-            )
+            Challenge(**VALID_CHALLENGE_FIELDS, interval=0)
 
     def test_ease_factor_bounds(self):
         """Ease factor must be between 1.3 and 3.0."""
         with pytest.raises(ValidationError):
-            Challenge(
-                title="Test",
-                description="Description",
-                language="python",
-                ease_factor=1.2,
-            )
+            Challenge(**VALID_CHALLENGE_FIELDS, ease_factor=1.2)
 
         with pytest.raises(ValidationError):
-            Challenge(
-                title="Test",
-                description="Description",
-                language="python",
-                ease_factor=3.1,
-            )
+            Challenge(**VALID_CHALLENGE_FIELDS, ease_factor=3.1)
 
 
 class TestChallengeSerialization:
@@ -254,11 +180,7 @@ class TestChallengeSerialization:
 
     def test_model_dump(self):
         """model_dump() should return a dictionary."""
-        c = Challenge(
-            title="Test",
-            description="Description",
-            language="python",
-        )
+        c = Challenge(**VALID_CHALLENGE_FIELDS)
         data = c.model_dump()
         assert isinstance(data, dict)
         assert data["title"] == "Test"
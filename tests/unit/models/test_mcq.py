@@ -7,6 +7,14 @@ from pydantic import ValidationError
 
 from src.models.mcq import MCQQuestion
 
+TRUE_FALSE = {
+    "question_type": "true_false",
+    "option_a": "True",
+    "option_b": "False",
+    "option_c": None,
+    "option_d": None,
+}
+
 
 class TestMCQCreation:
     """Tests for MCQ question creation and validation."""
@@ -74,205 +82,92 @@ class TestMCQCreation:
 class TestMCQTypeValidation:
     """Tests for question type validation."""
 
-    def test_mcq_requires_four_options(self):
-        """MCQ type requires all four options."""
-        with pytest.raises(ValidationError, match="MCQ questions require"):
-            MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                correct_option="a",
-            )
-
-    def test_mcq_requires_option_c(self):
-        """MCQ type requires option_c."""
-        with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                option_d="D",
-                correct_option="a",
-            )
-
-    def test_mcq_requires_option_d(self):
-        """MCQ type requires option_d."""
-        with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                option_c="C",
-                correct_option="a",
-            )
-
-    def test_true_false_only_two_options(self):
-        """True/False should only have options A and B."""
-        with pytest.raises(ValidationError, match="True/False questions"):
-            MCQQuestion(
-                question="Test",
-                question_type="true_false",
-                option_a="True",
-                option_b="False",
-                option_c="Maybe",
-                correct_option="a",
-            )
-
-    def test_true_false_no_option_d(self):
-        """True/False should not have option D."""
-        with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="true_false",
-                option_a="True",
-                option_b="False",
-                option_d="Neither",
-                correct_option="a",
-            )
-
-    def test_invalid_question_type(self):
-        """Invalid question type should fail."""
-        with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="multiple_choice",  # Invalid
-                option_a="A",
-                option_b="B",
-                option_c="C",
-                option_d="D",
-                correct_option="a",
-            )
+    @pytest.mark.parametrize(
+        "overrides,match",
+        [
+            # MCQ type requires all four options
+            ({"option_c": None, "option_d": None}, "MCQ questions require"),
+            ({"option_c": None}, "MCQ questions require"),
+            ({"option_d": None}, "MCQ questions require"),
+            # True/False should only have options A and B
+            ({**TRUE_FALSE, "option_c": "Maybe"}, "True/False questions"),
+            ({**TRUE_FALSE, "option_d": "Neither"}, "True/False questions"),
+            # Invalid question type
+            ({"question_type": "multiple_choice"}, "question_type"),
+        ],
+    )
+    def test_invalid_type_and_options_fail(self, make_mcq, overrides, match):
+        """Options must match the question type."""
+        with pytest.raises(ValidationError, match=match):
+            make_mcq(**overrides)
 
 
 class TestMCQCorrectOption:
     """Tests for correct option validation."""
 
-    def test_valid_correct_options_mcq(self):
+    @pytest.mark.parametrize("opt", ["a", "b", "c", "d"])
+    def test_valid_correct_options_mcq(self, make_mcq, opt):
         """MCQ accepts a, b, c, d as correct options."""
-        for opt in ["a", "b", "c", "d"]:
-            mcq = MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                option_c="C",
-                option_d="D",
-                correct_option=opt,
-            )
-            assert mcq.correct_option == opt
-
-    def test_true_false_only_accepts_a_or_b(self):
-        """True/False only accepts a or b as correct option."""
-        with pytest.raises(
-            ValidationError, match="correct_option must be 'a' or 'b'"
-        ):
-            MCQQuestion(
-                question="Test",
-                question_type="true_false",
-                option_a="True",
-                option_b="False",
-                correct_option="c",
-            )
-
-    def test_invalid_correct_option_letter(self):
-        """Invalid option letter should fail."""
-        with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                option_c="C",
-                option_d="D",
-                correct_option="e",
-            )
+        mcq = make_mcq(correct_option=opt)
+        assert mcq.correct_option == opt
+
+    @pytest.mark.parametrize(
+        "overrides,match",
+        [
+            # True/False only accepts a or b
+            (
+                {**TRUE_FALSE, "correct_option": "c"},
+                "correct_option must be 'a' or 'b'",
+            ),
+            # Invalid option letter
+            ({"correct_option": "e"}, "correct_option"),
+        ],
+    )
+    def test_invalid_correct_option_fails(self, make_mcq, overrides, match):
+        """Correct option must be a valid letter for the question type."""
+        with pytest.raises(ValidationError, match=match):
+            make_mcq(**overrides)
 
 
 class TestMCQQuestionText:
     """Tests for question text validation."""
 
-    def test_empty_question_fails(self):
+    def test_empty_question_fails(self, make_mcq):
         """Empty question should raise ValidationError."""
         with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                option_c="C",
-                option_d="D",
-                correct_option="a",
-            )
+            make_mcq(question="")
 
-    def test_whitespace_only_question_fails(self):
+    def test_whitespace_only_question_fails(self, make_mcq):
         """Whitespace-only question should fail."""
         with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="   ",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                option_c="C",
-                option_d="D",
-                correct_option="a",
-            )
+            make_mcq(question="   ")
 
-    def test_question_gets_stripped(self):
+    def test_question_gets_stripped(self, make_mcq):
         """Question text should be stripped."""
-        mcq = MCQQuestion(
-            question="  What is Python?  ",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-        )
+        mcq = make_mcq(question="  What is Python?  ")
         assert mcq.question == "What is Python?"
 
 
 class TestMCQOptions:
     """Tests for option field validation."""
 
-    def test_empty_option_a_fails(self):
+    def test_empty_option_a_fails(self, make_mcq):
         """Empty option A should fail."""
         with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="",
-                option_b="B",
-                option_c="C",
-                option_d="D",
-                correct_option="a",
-            )
+            make_mcq(option_a="")
 
-    def test_empty_option_b_fails(self):
+    def test_empty_option_b_fails(self, make_mcq):
         """Empty option B should fail."""
         with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="A",
-                option_b="",
-                option_c="C",
-                option_d="D",
-                correct_option="a",
-            )
+            make_mcq(option_b="")
 
-    def test_options_get_stripped(self):
+    def test_options_get_stripped(self, make_mcq):
         """Options should be stripped of whitespace."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
+        mcq = make_mcq(
             option_a="  A  ",
             option_b="  B  ",
             option_c="  C  ",
             option_d="  D  ",
-            correct_option="a",
         )
         assert mcq.option_a == "A"
         assert mcq.option_b == "B"
@@ -283,32 +178,17 @@ class TestMCQOptions:
 class TestMCQExplanations:
     """Tests for explanation fields."""
 
-    def test_explanations_optional(self):
+    def test_explanations_optional(self, make_mcq):
         """Explanations are optional."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-        )
+        mcq = make_mcq()
         assert mcq.explanation_a is None
         assert mcq.explanation_b is None
         assert mcq.explanation_c is None
         assert mcq.explanation_d is None
 
-    def test_all_explanations(self):
+    def test_all_explanations(self, make_mcq):
         """All four explanations can be provided."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
+        mcq = make_mcq(
             explanation_a="Why A",
             explanation_b="Why B",
             explanation_c="Why C",
@@ -319,201 +199,109 @@ class TestMCQExplanations:
         assert mcq.explanation_c == "Why C"
         assert mcq.explanation_d == "Why D"
 
-    def test_partial_explanations(self):
+    def test_partial_explanations(self, make_mcq):
         """Some explanations can be provided."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="b",
-            explanation_b="This is correct",
-        )
+        mcq = make_mcq(correct_option="b", explanation_b="This is correct")
         assert mcq.explanation_a is None
         assert mcq.explanation_b == "This is correct"
 
-    def test_explanations_get_stripped(self):
+    def test_explanations_get_stripped(self, make_mcq):
         """Explanations should be stripped."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-            explanation_a="  Explanation  ",
-        )
+        mcq = make_mcq(explanation_a="  Explanation  ")
         assert mcq.explanation_a == "Explanation"
 
-    def test_whitespace_only_explanation_becomes_none(self):
+    def test_whitespace_only_explanation_becomes_none(self, make_mcq):
         """Whitespace-only explanation becomes None."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-            explanation_a="   ",
-        )
+        mcq = make_mcq(explanation_a="   ")
         assert mcq.explanation_a is None
 
 
 class TestMCQTags:
     """Tests for tag handling in MCQ model."""
 
-    def test_tags_optional(self):
+    def test_tags_optional(self, make_mcq):
         """Tags are optional."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-        )
+        mcq = make_mcq()
         assert mcq.tags is None
 
-    def test_tags_normalization(self):
+    def test_tags_normalization(self, make_mcq):
         """Tags should be stripped."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-            tags="  python, oop  ",
-        )
+        mcq = make_mcq(tags="  python, oop  ")
         assert mcq.tags == "python, oop"
 
-    def test_whitespace_only_tags_becomes_none(self):
+    def test_whitespace_only_tags_becomes_none(self, make_mcq):
         """Whitespace-only tags becomes None."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-            tags="   ",
-        )
+        mcq = make_mcq(tags="   ")
         assert mcq.tags is None
 
 
 class TestMCQSM2Fields:
     """Tests for SM-2 algorithm fields."""
 
-    def test_default_sm2_values(self):
+    def test_default_sm2_values(self, make_mcq):
         """Default SM2 values should be set."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-        )
+        mcq = make_mcq()
         assert mcq.interval == 1
         assert mcq.ease_factor == 2.5
 
-    def test_default_last_reviewed_is_today(self):
+    def test_default_last_reviewed_is_today(self, make_mcq, frozen_today):
         """Default last_reviewed should be today."""
-        mcq = MCQQuestion(
-            question="Test",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-        )
-        assert mcq.last_reviewed == date.today()
+        mcq = make_mcq()
+        assert mcq.last_reviewed == frozen_today
 
-    def test_interval_minimum_bound(self):
+    def test_interval_minimum_bound(self, make_mcq):
         """Interval must be at least 1."""
         with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                option_c="C",
-                option_d="D",
-                correct_option="a",
-                interval=0,
-            )
+            make_mcq(interval=0)
 
-    def test_ease_factor_bounds(self):
+    def test_ease_factor_bounds(self, make_mcq):
         """Ease factor must be between 1.3 and 3.0."""
         with pytest.raises(ValidationError):
-            MCQQuestion(
-                question="Test",
-                question_type="mcq",
-                option_a="A",
-                option_b="B",
-                option_c="C",
-                option_d="D",
-                correct_option="a",
-                ease_factor=1.2,
-            )
+            make_mcq(ease_factor=1.2)
 
 
 class TestMCQSerialization:
     """Tests for MCQ model serialization."""
 
-    def test_model_dump(self):
+    def test_model_dump(self, make_mcq):
         """model_dump() should return a dictionary."""
-        mcq = MCQQuestion(
-            question="Test question",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="b",
-        )
+        mcq = make_mcq(question="Test question", correct_option="b")
         data = mcq.model_dump()
         assert isinstance(data, dict)
         assert data["question"] == "Test question"
         assert data["question_type"] == "mcq"
         assert data["correct_option"] == "b"
 
-    def test_str_representation(self):
+    def test_str_representation(self, make_mcq):
         """String representation should show key info."""
-        mcq = MCQQuestion(
-            id=42,
-            question="What is Python?",
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-        )
+        mcq = make_mcq(id=42, question="What is Python?")
         string = str(mcq)
         assert "42" in string
         assert "mcq" in string
 
-    def test_str_representation_long_question(self):
+    def test_str_representation_long_question(self, make_mcq):
         """Long question should be truncated in string repr."""
         long_question = "A" * 100
-        mcq = MCQQuestion(
-            question=long_question,
-            question_type="mcq",
-            option_a="A",
-            option_b="B",
-            option_c="C",
-            option_d="D",
-            correct_option="a",
-        )
+        mcq = make_mcq(question=long_question)
         string = str(mcq)
         assert "..." in string
+
+
+class TestMCQValidateMany:
+    """Tests for batch validation of MCQ rows."""
+
+    def test_validate_many_runs_model_validator(self):
+        """Batch validation should apply the question type rules."""
+        with pytest.raises(ValidationError, match="True/False questions"):
+            MCQQuestion.validate_many(
+                [
+                    {
+                        "question": "Test",
+                        "question_type": "true_false",
+                        "option_a": "True",
+                        "option_b": "False",
+                        "option_c": "Maybe",
+                        "correct_option": "a",
+                    }
+                ]
+            )
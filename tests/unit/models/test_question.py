@@ -57,61 +57,61 @@ class TestQuestionCreation:
 class TestQuestionTags:
     """Tests for tag handling in Question model."""
 
-    def test_tags_normalization(self):
+    def test_tags_normalization(self, make_question):
         """Tags should be stripped of whitespace."""
-        q = Question(question_text="Test", tags="  python, oop  ")
+        q = make_question(tags="  python, oop  ")
         assert q.tags == "python, oop"
 
-    def test_tags_empty_string_preserved(self):
+    def test_tags_empty_string_preserved(self, make_question):
         """Empty string tags are preserved (validator only strips)."""
-        q = Question(question_text="Test", tags="")
+        q = make_question(tags="")
         assert q.tags == ""
 
-    def test_tags_none_when_whitespace_only(self):
+    def test_tags_none_when_whitespace_only(self, make_question):
         """Whitespace-only tags should become None."""
-        q = Question(question_text="Test", tags="   ")
+        q = make_question(tags="   ")
         assert q.tags is None
 
-    def test_tags_optional(self):
+    def test_tags_optional(self, make_question):
         """Tags are optional."""
-        q = Question(question_text="Test")
+        q = make_question()
         assert q.tags is None
 
 
 class TestQuestionSM2Fields:
     """Tests for SM-2 algorithm fields."""
 
-    def test_default_interval(self):
+    def test_default_interval(self, make_question):
         """Default interval should be 1."""
-        q = Question(question_text="Test")
+        q = make_question()
         assert q.interval == 1
 
-    def test_default_ease_factor(self):
+    def test_default_ease_factor(self, make_question):
         """Default ease factor should be 2.5."""
-        q = Question(question_text="Test")
+        q = make_question()
         assert q.ease_factor == 2.5
 
-    def test_interval_minimum_bound(self):
+    def test_interval_minimum_bound(self, make_question):
         """Interval must be at least 1."""
         with pytest.raises(ValidationError):
-            Question(question_text="Test", interval=0)
+            make_question(interval=0)
 
-    def test_ease_factor_minimum_bound(self):
+    def test_ease_factor_minimum_bound(self, make_question):
         """Ease factor must be at least 1.3."""
         with pytest.raises(ValidationError):
-            Question(question_text="Test", ease_factor=1.2)
+            make_question(ease_factor=1.2)
 
-    def test_ease_factor_maximum_bound(self):
+    def test_ease_factor_maximum_bound(self, make_question):
         """Ease factor must be at most 3.0."""
         with pytest.raises(ValidationError):
-            Question(question_text="Test", ease_factor=3.1)
+            make_question(ease_factor=3.1)
 
-    def test_valid_ease_factor_bounds(self):
+    def test_valid_ease_factor_bounds(self, make_question):
         """Ease factor at boundaries should work."""
-        q1 = Question(question_text="Test", ease_factor=1.3)
+        q1 = make_question(ease_factor=1.3)
         assert q1.ease_factor == 1.3
 
-        q2 = Question(question_text="Test", ease_factor=3.0)
+        q2 = make_question(ease_factor=3.0)
         assert q2.ease_factor == 3.0
 
 
@@ -157,7 +157,30 @@ class TestQuestionWithId:
         q = Question(id=123, question_text="Test")
         assert q.id == 123
 
-    def test_question_without_id(self):
+    def test_question_without_id(self, make_question):
         """Question ID defaults to None."""
-        q = Question(question_text="Test")
+        q = make_question()
         assert q.id is None
+
+
+class TestQuestionValidateMany:
+    """Tests for batch validation of Question rows."""
+
+    def test_validate_many_returns_models_in_order(self):
+        """Rows should be validated and returned in input order."""
+        questions = Question.validate_many(
+            [
+                {"question_text": "  First  ", "tags": "   "},
+                {"question_text": "Second", "tags": "python"},
+            ]
+        )
+        assert [q.question_text for q in questions] == ["First", "Second"]
+        assert questions[0].tags is None
+        assert all(isinstance(q, Question) for q in questions)
+
+    def test_validate_many_rejects_invalid_row(self):
+        """A single invalid row should fail the whole batch."""
+        with pytest.raises(ValidationError):
+            Question.validate_many(
+                [{"question_text": "Valid"}, {"question_text": "   "}]
+            )
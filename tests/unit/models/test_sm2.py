@@ -113,6 +113,19 @@ class TestCalculateNextReview:
             assert new_interval >= 1
             assert 1.3 <= new_ef <= 3.5
 
+    def test_fractional_rating_between_whole_ratings(self):
+        """Fractional ratings should interpolate between whole ratings."""
+        _, hard_ef = SM2Calculator.calculate_next_review(
+            rating=1, current_interval=5, current_ease_factor=2.5
+        )
+        _, between_ef = SM2Calculator.calculate_next_review(
+            rating=1.5, current_interval=5, current_ease_factor=2.5
+        )
+        _, good_ef = SM2Calculator.calculate_next_review(
+            rating=2.0, current_interval=5, current_ease_factor=2.5
+        )
+        assert hard_ef < between_ef < good_ef
+
     def test_return_types(self):
         """Should return tuple of (int, float)."""
         result = SM2Calculator.calculate_next_review(
@@ -123,6 +136,52 @@ class TestCalculateNextReview:
         assert isinstance(result[1], float)
 
 
+INTERVALS = [1, 2, 7, 365, 10_000]
+EASE_FACTORS = [1.3, 1.7, 2.5, 3.5]
+
+
+class TestCalculateNextReviewProperties:
+    """Invariants of calculate_next_review across a grid of inputs."""
+
+    @pytest.mark.parametrize("ef", EASE_FACTORS)
+    @pytest.mark.parametrize("interval", INTERVALS)
+    @pytest.mark.parametrize("rating", [0, 0.5, 1, 1.5, 2, 2.5, 3])
+    def test_interval_is_positive_int(self, rating, interval, ef):
+        """New interval should always be an int of at least one day."""
+        new_interval, _ = SM2Calculator.calculate_next_review(
+            rating=rating, current_interval=interval, current_ease_factor=ef
+        )
+        assert isinstance(new_interval, int)
+        assert new_interval >= 1
+
+    @pytest.mark.parametrize("ef", EASE_FACTORS)
+    @pytest.mark.parametrize("interval", INTERVALS)
+    def test_forgetting_resets_interval(self, interval, ef):
+        """Rating 0 should always reset to one day and keep EF >= 1.3."""
+        new_interval, new_ef = SM2Calculator.calculate_next_review(
+            rating=0, current_interval=interval, current_ease_factor=ef
+        )
+        assert new_interval == 1
+        assert new_ef >= 1.3
+
+    @pytest.mark.parametrize("ef", EASE_FACTORS)
+    @pytest.mark.parametrize("interval", INTERVALS)
+    def test_higher_rating_never_schedules_sooner(self, interval, ef):
+        """A better successful rating never lowers the interval or EF."""
+        results = [
+            SM2Calculator.calculate_next_review(
+                rating=rating,
+                current_interval=interval,
+                current_ease_factor=ef,
+            )
+            for rating in (1, 2, 3)
+        ]
+        intervals = [new_interval for new_interval, _ in results]
+        efs = [new_ef for _, new_ef in results]
+        assert intervals == sorted(intervals)
+        assert efs == sorted(efs)
+
+
 class TestCalculateMCQReview:
     """Tests for the calculate_mcq_review method."""
 
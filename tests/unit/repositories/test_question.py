@@ -0,0 +1,60 @@
+"""Tests for the Question repository."""
+
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.db import database_manager
+from src.models.question import Question
+from src.repositories.question import QuestionRepository
+
+SCHEMA_PATH = Path(__file__).parents[2] / "schema.sql"
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    """Create a repository backed by a fresh on-disk database."""
+    db_path = tmp_path / "questions.db"
+    with sqlite3.connect(db_path) as conn:
+        conn.executescript(SCHEMA_PATH.read_text(encoding="utf-8"))
+    conn.close()
+
+    monkeypatch.setattr(
+        database_manager, "get_connection", lambda: sqlite3.connect(db_path)
+    )
+    return QuestionRepository()
+
+
+class TestQuestionRoundTrip:
+    """Tests for reading stored questions back as models."""
+
+    def test_round_trip_keeps_field_types(self, repository, sample_question):
+        """A reviewed question should come back with typed fields."""
+        saved = repository.add(sample_question)
+        repository.mark_reviewed(saved, 2)
+
+        loaded = repository.get_by_id(saved.id)
+
+        assert isinstance(loaded, Question)
+        assert loaded.id == saved.id
+        assert loaded.question_text == sample_question.question_text
+        assert loaded.tags == sample_question.tags
+        assert isinstance(loaded.last_reviewed, date)
+        assert isinstance(loaded.interval, int)
+        assert isinstance(loaded.ease_factor, float)
+
+    def test_reads_stored_values_without_revalidating(
+        self, repository, sample_question
+    ):
+        """Stored SM-2 values should be returned exactly as written."""
+        saved = repository.add(sample_question)
+        saved.ease_factor = 1.3
+        repository.mark_reviewed(saved, 1)
+
+        loaded = repository.get_by_id(saved.id)
+
+        assert loaded.last_reviewed == date.today()
+        assert loaded.ease_factor == 1.16
+        assert loaded.ease_factor < 1.3
@@ -1,6 +1,7 @@
 """Tests for Z.AI API client."""
+import json
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import httpx
 import pytest
@@ -9,6 +10,20 @@ from src.models.evaluation import Message
 from src.services.api_client import APIError, ZAIClient
 
 
+@pytest.fixture(scope="module")
+def client():
+    """
+    Create client with test key, shared across the module.
+
+    Building the underlying httpx.Client loads the TLS trust store, which
+    dominates these tests; tests swap in a fake transport through
+    monkeypatch, which restores the real one afterwards.
+    """
+    client = ZAIClient(api_key="test-key")
+    yield client
+    client.close()
+
+
 class TestZAIClientInit:
     """Tests for ZAIClient initialization."""
 
@@ -49,17 +64,18 @@ class TestZAIClientInit:
         assert client.base_url == "https://custom.api.com"
         client.close()
 
+    def test_keeps_idle_connection_alive(self):
+        """Should keep the pooled connection alive between requests."""
+        with patch("httpx.Client") as client_class:
+            ZAIClient(api_key="key")
+
+        limits = client_class.call_args.kwargs["limits"]
+        assert limits.keepalive_expiry == ZAIClient.KEEPALIVE_EXPIRY
+
 
 class TestZAIClientChatCompletion:
     """Tests for chat completion API calls."""
 
-    @pytest.fixture
-    def client(self):
-        """Create client with test key."""
-        client = ZAIClient(api_key="test-key")
-        yield client
-        client.close()
-
     @pytest.fixture
     def messages(self):
         """Create test messages."""
@@ -68,71 +84,92 @@ class TestZAIClientChatCompletion:
             Message(role="user", content="Hello"),
         ]
 
-    def test_chat_completion_success(self, client, messages):
+    @pytest.fixture
+    def serve(self, client, monkeypatch, request):
+        """
+        Route the client's requests to canned responses.
+
+        Returns a function that installs the responses (exceptions are
+        raised instead) and returns the list of recorded requests.
+        """
+
+        def install(*responses):
+            requests = []
+            pending = iter(responses)
+
+            def handler(request):
+                requests.append(request)
+                response = next(pending)
+                if isinstance(response, Exception):
+                    raise response
+                return response
+
+            fake = httpx.Client(
+                transport=httpx.MockTransport(handler),
+                timeout=client.timeout,
+            )
+            request.addfinalizer(fake.close)
+            monkeypatch.setattr(client, "_client", fake)
+            return requests
+
+        return install
+
+    def test_chat_completion_success(self, client, messages, serve):
         """Should return assistant message on success."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Test response"}}]
-        }
-        mock_response.raise_for_status = Mock()
+        serve(
+            httpx.Response(
+                200,
+                json={"choices": [{"message": {"content": "Test response"}}]},
+            )
+        )
 
-        with patch.object(client._client, "post", return_value=mock_response):
-            result = client.chat_completion(messages)
+        result = client.chat_completion(messages)
 
         assert result == "Test response"
 
-    def test_chat_completion_sends_correct_payload(self, client, messages):
+    def test_chat_completion_sends_correct_payload(
+        self, client, messages, serve
+    ):
         """Should send correctly formatted payload."""
-        mock_response = Mock()
-        mock_response.json.return_value = {
-            "choices": [{"message": {"content": "Response"}}]
-        }
-        mock_response.raise_for_status = Mock()
-
-        with patch.object(
-            client._client, "post", return_value=mock_response
-        ) as mock_post:
-            client.chat_completion(messages, model="glm-4.7", temperature=0.5)
-
-        call_kwargs = mock_post.call_args
-        payload = call_kwargs.kwargs["json"]
+        requests = serve(
+            httpx.Response(
+                200, json={"choices": [{"message": {"content": "Response"}}]}
+            )
+        )
+
+        client.chat_completion(messages, model="glm-4.7", temperature=0.5)
+
+        (request,) = requests
+        assert request.method == "POST"
+        assert str(request.url) == f"{client.base_url}/chat/completions"
+        assert request.headers["Authorization"] == "Bearer test-key"
+        payload = json.loads(request.content)
         assert payload["model"] == "glm-4.7"
         assert payload["temperature"] == 0.5
         assert len(payload["messages"]) == 2
 
-    def test_chat_completion_http_error(self, client, messages):
+    def test_chat_completion_http_error(self, client, messages, serve):
         """Should raise APIError on HTTP error."""
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.text = "Internal Server Error"
+        serve(httpx.Response(500, text="Internal Server Error"))
 
-        error = httpx.HTTPStatusError(
-            "Error", request=Mock(), response=mock_response
-        )
-
-        with patch.object(client._client, "post", side_effect=error):
-            with pytest.raises(APIError, match="API request failed"):
-                client.chat_completion(messages)
+        with pytest.raises(APIError, match="API request failed: 500"):
+            client.chat_completion(messages)
 
-    def test_chat_completion_network_error(self, client, messages):
+    def test_chat_completion_network_error(self, client, messages, serve):
         """Should raise APIError on network error."""
-        with patch.object(
-            client._client,
-            "post",
-            side_effect=httpx.RequestError("Connection failed"),
-        ):
-            with pytest.raises(APIError, match="Network error"):
-                client.chat_completion(messages)
-
-    def test_chat_completion_invalid_response_format(self, client, messages):
+        serve(httpx.ConnectError("Connection failed"))
+
+        with pytest.raises(APIError, match="Network error"):
+            client.chat_completion(messages)
+
+    def test_chat_completion_invalid_response_format(
+        self, client, messages, serve
+    ):
         """Should raise APIError on unexpected response format."""
-        mock_response = Mock()
-        mock_response.json.return_value = {"unexpected": "format"}
-        mock_response.raise_for_status = Mock()
+        serve(httpx.Response(200, json={"unexpected": "format"}))
 
-        with patch.object(client._client, "post", return_value=mock_response):
-            with pytest.raises(APIError, match="Unexpected API response"):
-                client.chat_completion(messages)
+        with pytest.raises(APIError, match="Unexpected API response"):
+            client.chat_completion(messages)
 
 
 class TestZAIClientContextManager:
@@ -1,5 +1,5 @@
 """Tests for evaluation service."""
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 
@@ -7,24 +7,48 @@ from src.models.evaluation import EvaluationResponse, EvaluationSession
 from src.services.api_client import APIError
 from src.services.evaluator import EvaluationService
 
+DEFAULT_RESPONSE = (
+    "Correctness: 3/3\nClarity: 2/3\nEfficiency: 2/3\n**Score: 2.33/3**"
+)
+
+
+class FakeAPIClient:
+    """
+    Stand-in for ZAIClient that replays canned responses.
+
+    Responses are returned in order and the last one is repeated once
+    the list runs out. Exception instances are raised instead of returned.
+    """
+
+    def __init__(self, *responses):
+        self.responses = list(responses) or [DEFAULT_RESPONSE]
+        self.chat_completion_calls = []
+        self.closed = False
+
+    def chat_completion(self, messages, **kwargs):
+        self.chat_completion_calls.append((list(messages), kwargs))
+        calls = len(self.chat_completion_calls)
+        response = self.responses[min(calls, len(self.responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def close(self):
+        self.closed = True
+
 
 class TestEvaluationService:
     """Tests for EvaluationService."""
 
     @pytest.fixture
-    def mock_client(self):
-        """Create mock API client."""
-        client = Mock()
-        client.chat_completion.return_value = (
-            "Correctness: 3/3\nClarity: 2/3\n"
-            "Efficiency: 2/3\n**Score: 2.33/3**"
-        )
-        return client
+    def fake_client(self):
+        """Create fake API client."""
+        return FakeAPIClient()
 
     @pytest.fixture
-    def service(self, mock_client):
-        """Create service with mock client."""
-        return EvaluationService(api_client=mock_client)
+    def service(self, fake_client):
+        """Create service with fake client."""
+        return EvaluationService(api_client=fake_client)
 
     def test_create_session(self, service):
         """Should create session with system prompt."""
@@ -53,14 +77,13 @@ class TestEvaluationService:
         assert session.iteration == 1
         assert isinstance(result, EvaluationResponse)
 
-    def test_evaluate_includes_solution_in_prompt(self, service, mock_client):
+    def test_evaluate_includes_solution_in_prompt(self, service, fake_client):
         """Should include solution code in the prompt."""
         session = service.create_session(1, "/path", "/folder")
 
         service.evaluate(session, "def my_solution(): return 42")
 
-        call_args = mock_client.chat_completion.call_args
-        messages = call_args[0][0]
+        messages, _ = fake_client.chat_completion_calls[-1]
         user_message = messages[1]
         assert "def my_solution(): return 42" in user_message.content
 
@@ -75,12 +98,9 @@ class TestEvaluationService:
         assert "disagree" in session.messages[3].content.lower()
         assert session.iteration == 2
 
-    def test_dispute_preserves_first_grade(self, service, mock_client):
+    def test_dispute_preserves_first_grade(self, service, fake_client):
         """Should preserve first grade after dispute."""
-        mock_client.chat_completion.side_effect = [
-            "Score: 1.5/3",
-            "Score: 2.5/3",
-        ]
+        fake_client.responses = ["Score: 1.5/3", "Score: 2.5/3"]
         session = service.create_session(1, "/path", "/folder")
         service.evaluate(session, "def hello(): pass")
 
@@ -100,9 +120,9 @@ class TestEvaluationService:
         assert "refactored" in session.messages[3].content.lower()
         assert "Better" in session.messages[3].content
 
-    def test_full_conversation_flow(self, service, mock_client):
+    def test_full_conversation_flow(self, service, fake_client):
         """Should maintain full conversation history."""
-        mock_client.chat_completion.side_effect = [
+        fake_client.responses = [
             "Score: 1.5/3 - needs improvement",
             "Score: 2.0/3 - valid point",
             "Score: 2.8/3 - much better",
@@ -119,11 +139,80 @@ class TestEvaluationService:
         assert session.iteration == 3
         assert len(session.messages) == 7
 
-    def test_close_closes_client(self, mock_client):
+    def test_full_history_sent_by_default(self, service, fake_client):
+        """Should send the whole conversation when no window is set."""
+        session = service.create_session(1, "/path", "/folder")
+        service.evaluate(session, "def v1(): pass")
+        service.dispute(session, "I handled edge cases")
+
+        messages, _ = fake_client.chat_completion_calls[-1]
+        assert messages == session.messages[:-1]
+
+    def test_context_window_limits_sent_messages(self, fake_client):
+        """Should send the first exchange plus the most recent messages."""
+        fake_client.responses = [
+            "Score: 1.5/3",
+            "Score: 2.0/3",
+            "Score: 2.8/3",
+        ]
+        service = EvaluationService(
+            api_client=fake_client, max_context_messages=2
+        )
+        session = service.create_session(1, "/path", "/folder")
+
+        service.evaluate(session, "def v1(): pass")
+        service.dispute(session, "I handled edge cases")
+        service.refactor_evaluate(session, "def v2(): return True")
+
+        messages, _ = fake_client.chat_completion_calls[-1]
+        assert [m.role for m in messages] == [
+            "system",
+            "user",
+            "assistant",
+            "user",
+        ]
+        assert messages[:2] == session.messages[:2]
+        assert messages[2:] == session.messages[4:6]
+        assert len(session.messages) == 7
+        assert session.first_grade == 1.5
+        assert session.current_grade == 2.8
+
+    @pytest.mark.parametrize("max_context_messages", [1, 2, 3])
+    def test_context_window_keeps_solution(
+        self, fake_client, max_context_messages
+    ):
+        """Should always send the original solution, even after disputes."""
+        service = EvaluationService(
+            api_client=fake_client, max_context_messages=max_context_messages
+        )
+        session = service.create_session(1, "/path", "/folder")
+        service.evaluate(session, "def original_solution(): pass")
+
+        for round_number in range(4):
+            service.dispute(session, f"Dispute {round_number}")
+
+        messages, _ = fake_client.chat_completion_calls[-1]
+        assert messages[0].role == "system"
+        assert "def original_solution(): pass" in messages[1].content
+        assert messages[-1].content == session.messages[-2].content
+        assert "Dispute 3" in messages[-1].content
+
+    @pytest.mark.parametrize("max_context_messages", [0, -1])
+    def test_context_window_must_be_positive(
+        self, fake_client, max_context_messages
+    ):
+        """Should reject windows that would drop the latest message."""
+        with pytest.raises(ValueError, match="max_context_messages"):
+            EvaluationService(
+                api_client=fake_client,
+                max_context_messages=max_context_messages,
+            )
+
+    def test_close_closes_client(self, fake_client):
         """Should close the API client."""
-        service = EvaluationService(api_client=mock_client)
+        service = EvaluationService(api_client=fake_client)
         service.close()
-        mock_client.close.assert_called_once()
+        assert fake_client.closed
 
     def test_lazy_client_initialization(self):
         """Should lazily initialize client when needed."""
@@ -133,9 +222,7 @@ class TestEvaluationService:
         with patch(
             "src.services.evaluator.ZAIClient"
         ) as mock_client_class:
-            mock_instance = Mock()
-            mock_instance.chat_completion.return_value = "Score: 2/3"
-            mock_client_class.return_value = mock_instance
+            mock_client_class.return_value = FakeAPIClient("Score: 2/3")
 
             session = service.create_session(1, "/path", "/folder")
             service.evaluate(session, "code")
@@ -148,10 +235,9 @@ class TestEvaluationServiceErrorHandling:
 
     def test_api_error_propagates(self):
         """Should propagate API errors."""
-        mock_client = Mock()
-        mock_client.chat_completion.side_effect = APIError("API failed")
+        fake_client = FakeAPIClient(APIError("API failed"))
 
-        service = EvaluationService(api_client=mock_client)
+        service = EvaluationService(api_client=fake_client)
         session = service.create_session(1, "/path", "/folder")
 
         with pytest.raises(APIError, match="API failed"):
@@ -159,10 +245,9 @@ class TestEvaluationServiceErrorHandling:
 
     def test_parse_error_propagates(self):
         """Should propagate parse errors."""
-        mock_client = Mock()
-        mock_client.chat_completion.return_value = "No grade here!"
+        fake_client = FakeAPIClient("No grade here!")
 
-        service = EvaluationService(api_client=mock_client)
+        service = EvaluationService(api_client=fake_client)
         session = service.create_session(1, "/path", "/folder")
 
         with pytest.raises(ValueError, match="Could not extract grade"):